@@ -5,6 +5,7 @@ import hashlib
 import json
 import os
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -236,8 +237,44 @@ class AIResponseCache:
             self._cleanup_task = None
 
 
-# Global cache instance
+class MemoryResponseCache:
+    """Small in-process LRU for AI responses to repeated prompts."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a compact cache key from the parts identifying a prompt."""
+        return hashlib.blake2b("\x00".join(parts).encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response and mark it most recently used."""
+        value = self._entries.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+    def set(self, key: str, value: str):
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+# Global cache instances
 _global_cache = None
+_memory_cache = None
 
 
 def get_ai_cache() -> AIResponseCache:
@@ -246,3 +283,11 @@ def get_ai_cache() -> AIResponseCache:
     if _global_cache is None:
         _global_cache = AIResponseCache()
     return _global_cache
+
+
+def get_memory_response_cache() -> MemoryResponseCache:
+    """Get global in-memory AI response cache instance."""
+    global _memory_cache
+    if _memory_cache is None:
+        _memory_cache = MemoryResponseCache()
+    return _memory_cache
@@ -0,0 +1,166 @@
+"""Conversation History Storage - Pluggable backends for session history."""
+
+import json
+import logging
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, List
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+DEFAULT_MAX_ENTRIES = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryStore(ABC):
+    """Base class for conversation history backends."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def append(self, entry: Dict[str, Any]):
+        """Store a single history entry."""
+        pass
+
+    @abstractmethod
+    def tail(self, count: int) -> List[Dict[str, Any]]:
+        """Return the newest ``count`` entries, oldest first."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        pass
+
+
+class InMemoryHistoryStore(HistoryStore):
+    """Bounded in-process history backed by a deque."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super().__init__(max_entries)
+        self._entries = deque(maxlen=max_entries)
+
+    def append(self, entry: Dict[str, Any]):
+        self._entries.append(entry)
+
+    def tail(self, count: int) -> List[Dict[str, Any]]:
+        recent = list(islice(reversed(self._entries), count))
+        recent.reverse()
+        return recent
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteHistoryStore(HistoryStore):
+    """History persisted to a SQLite table, trimmed to ``max_entries`` rows."""
+
+    def __init__(
+        self, session_id: str, db_path: str, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        super().__init__(max_entries)
+        self.session_id = session_id
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS history ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "session_id TEXT NOT NULL, "
+            "entry TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_history_session "
+            "ON history (session_id, id)"
+        )
+        self._conn.commit()
+
+    def append(self, entry: Dict[str, Any]):
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO history (session_id, entry) VALUES (?, ?)",
+                (self.session_id, json.dumps(entry, ensure_ascii=False)),
+            )
+            self._conn.execute(
+                "DELETE FROM history WHERE session_id = ? AND id NOT IN "
+                "(SELECT id FROM history WHERE session_id = ? "
+                "ORDER BY id DESC LIMIT ?)",
+                (self.session_id, self.session_id, self.max_entries),
+            )
+
+    def tail(self, count: int) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT entry FROM history WHERE session_id = ? "
+            "ORDER BY id DESC LIMIT ?",
+            (self.session_id, count),
+        ).fetchall()
+        return [json.loads(row[0]) for row in reversed(rows)]
+
+    def __len__(self) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM history WHERE session_id = ?", (self.session_id,)
+        ).fetchone()[0]
+
+
+class RedisHistoryStore(HistoryStore):
+    """History kept in a Redis list, newest entry at the head."""
+
+    def __init__(
+        self, session_id: str, url: str, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        if redis is None:
+            raise ImportError("redis package is not installed")
+        super().__init__(max_entries)
+        self.key = f"smart_cli:history:{session_id}"
+        self._client = redis.Redis.from_url(url)
+        self._client.ping()
+
+    def append(self, entry: Dict[str, Any]):
+        pipe = self._client.pipeline()
+        pipe.lpush(self.key, json.dumps(entry, ensure_ascii=False))
+        pipe.ltrim(self.key, 0, self.max_entries - 1)
+        pipe.execute()
+
+    def tail(self, count: int) -> List[Dict[str, Any]]:
+        if count <= 0:
+            return []
+        raw_entries = self._client.lrange(self.key, 0, count - 1)
+        return [json.loads(raw) for raw in reversed(raw_entries)]
+
+    def __len__(self) -> int:
+        return self._client.llen(self.key)
+
+
+def create_history_store(
+    session_id: str, max_entries: int = DEFAULT_MAX_ENTRIES
+) -> HistoryStore:
+    """Create the history backend selected by SMART_HISTORY_BACKEND.
+
+    Supported values are ``memory`` (default), ``sqlite`` and ``redis``. Any
+    backend that cannot be initialized falls back to in-memory storage.
+    """
+    backend = os.getenv("SMART_HISTORY_BACKEND", "memory").lower()
+
+    try:
+        if backend == "sqlite":
+            db_path = os.getenv(
+                "SMART_HISTORY_DB",
+                os.path.join(os.path.expanduser("~"), ".smart_cli_history.db"),
+            )
+            return SQLiteHistoryStore(session_id, db_path, max_entries)
+        if backend == "redis":
+            url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+            return RedisHistoryStore(session_id, url, max_entries)
+    except Exception as e:
+        logger.warning(
+            f"Could not initialize {backend} history backend, "
+            f"falling back to in-memory history: {e}"
+        )
+
+    return InMemoryHistoryStore(max_entries)
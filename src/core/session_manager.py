@@ -1,19 +1,36 @@
 """Smart CLI Session Manager - Core session handling."""
 
 import asyncio
+import os
+import time
 from datetime import datetime
 from typing import Optional
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.text import Text
 
 try:
     from .budget_profiles import get_profile_manager, UsageProfile
+    from .history_store import create_history_store
 except ImportError:
     from budget_profiles import get_profile_manager, UsageProfile
+    from history_store import create_history_store
 
 console = Console()
 
+# Oldest conversation turns are dropped beyond this many entries
+MAX_HISTORY_ENTRIES = 1000
+
+# Static parts of the welcome banner, built once at import
+_DIVIDER_80 = "─" * 80
+_DIVIDER_50 = "─" * 50
+_WELCOME_DIVIDER = Text(_DIVIDER_80, style="dim")
+_WELCOME_SUBDIVIDER = Text(_DIVIDER_50, style="dim")
+_WELCOME_STATUS = Text.assemble(
+    ("(✓) Sistem Statusu: ", "green"), ("Tam Hazır", "bold green")
+)
+
 
 class SessionManager:
     """Manages Smart CLI session lifecycle and state."""
@@ -22,42 +39,42 @@ class SessionManager:
         self.debug = debug
         self.session_id = f"smart_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.start_time = datetime.now()
-        self.conversation_history = []
+        self.history_store = create_history_store(
+            self.session_id, max_entries=MAX_HISTORY_ENTRIES
+        )
         self.session_active = False
         self.budget_manager = get_profile_manager()
         self.current_profile = None
+        # Resolved profile cache, refreshed whenever current_profile changes
+        self._cached_profile_type = None
+        self._current_profile_obj = None
+        self._profile_limits_line = ""
+        self._profile_list_key = None
+        self._profile_list_renderable = None
 
     def display_welcome(self):
         """Display Smart CLI welcome message."""
-        from rich.text import Text
-
-        # Clean startup banner
-        console.print("─" * 80, style="dim")
-
-        import os
-
         try:
             current_project = os.path.basename(os.getcwd())
         except (FileNotFoundError, OSError):
             current_project = "unknown"
 
-        header = Text()
-        header.append("SMART CLI", style="bold cyan")
-        header.append(" - Project: ", style="dim")
-        header.append(current_project, style="bold white")
+        header = Text.assemble(
+            ("SMART CLI", "bold cyan"),
+            (" - Project: ", "dim"),
+            (current_project, "bold white"),
+        )
 
-        console.print(header)
-        console.print("─" * 50, style="dim")
+        # Clean startup banner and system status in a single render pass
+        console.print(
+            Group(_WELCOME_DIVIDER, header, _WELCOME_SUBDIVIDER, _WELCOME_STATUS)
+        )
 
-        # System status
-        console.print("(✓) Sistem Statusu: ", style="green", end="")
-        console.print("Tam Hazır", style="bold green")
-        
         # Budget profile info
         if self.current_profile:
-            profile = self.budget_manager.get_profile(self.current_profile)
+            profile = self._get_current_profile_obj()
             console.print(f"(💰) Budget Profili: {profile.name}", style="cyan")
-            console.print(f"    Günlük limit: ${profile.daily_limit:.2f} | Aylıq: ${profile.monthly_limit:.2f}", style="dim cyan")
+            console.print(self._profile_limits_line, style="dim cyan")
         else:
             console.print("(💰) Budget Profili: Seçilməyib - 'budget' əmrini istifadə edin", style="dim yellow")
         
@@ -80,22 +97,67 @@ class SessionManager:
 
     def add_to_history(self, role: str, content: str):
         """Add message to conversation history."""
-        self.conversation_history.append(
-            {"role": role, "content": content, "timestamp": datetime.now().isoformat()}
+        self.history_store.append(
+            {"role": role, "content": content, "ts": time.time_ns()}
         )
 
     def get_recent_history(self, count: int = 10):
         """Get recent conversation history."""
-        return self.conversation_history[-count:]
+        return [
+            {
+                "role": entry["role"],
+                "content": entry["content"],
+                "timestamp": datetime.fromtimestamp(entry["ts"] / 1e9).isoformat(),
+            }
+            for entry in self.history_store.tail(count)
+        ]
     
+    def _get_current_profile_obj(self):
+        """Return the resolved current profile, re-resolved only when it changes."""
+        if self.current_profile is not self._cached_profile_type:
+            profile = (
+                self.budget_manager.get_profile(self.current_profile)
+                if self.current_profile
+                else None
+            )
+            self._cached_profile_type = self.current_profile
+            self._current_profile_obj = profile
+            self._profile_limits_line = (
+                f"    Günlük limit: ${profile.daily_limit:.2f} | "
+                f"Aylıq: ${profile.monthly_limit:.2f}"
+                if profile
+                else ""
+            )
+        return self._current_profile_obj
+
     def set_budget_profile(self, profile_type: UsageProfile):
         """Set current budget profile."""
         self.current_profile = profile_type
-        profile = self.budget_manager.get_profile(profile_type)
+        profile = self._get_current_profile_obj()
         console.print(f"✅ Budget profili dəyişdirildi: {profile.name}", style="green")
         console.print(f"   Günlük limit: ${profile.daily_limit:.2f}", style="dim green")
         console.print(f"   Aylıq limit: ${profile.monthly_limit:.2f}", style="dim green")
     
+    def _get_profile_list_renderable(self) -> Group:
+        """Return the available-profiles listing, rebuilt only on change."""
+        profiles = self.budget_manager.list_profiles()
+        if self._profile_list_key != id(profiles):
+            lines = []
+            for profile in profiles.values():
+                lines.append(
+                    Text(f"  • {profile.name}: {profile.description}", style="dim")
+                )
+                lines.append(
+                    Text(
+                        f"    Günlük: ${profile.daily_limit:.2f}, "
+                        f"Aylıq: ${profile.monthly_limit:.2f}",
+                        style="dim cyan",
+                    )
+                )
+            self._profile_list_key = id(profiles)
+            self._profile_list_renderable = Group(*lines)
+        return self._profile_list_renderable
+
     def get_budget_profile(self):
         """Get current budget profile."""
         return self.current_profile
@@ -105,12 +167,10 @@ class SessionManager:
         if not self.current_profile:
             console.print("❌ Budget profili seçilməyib", style="red")
             console.print("Mövcud profillər:", style="bold")
-            for profile_type, profile in self.budget_manager.list_profiles().items():
-                console.print(f"  • {profile.name}: {profile.description}", style="dim")
-                console.print(f"    Günlük: ${profile.daily_limit:.2f}, Aylıq: ${profile.monthly_limit:.2f}", style="dim cyan")
+            console.print(self._get_profile_list_renderable())
             return
         
-        profile = self.budget_manager.get_profile(self.current_profile)
+        profile = self._get_current_profile_obj()
         console.print(f"📊 Cari Budget Profili: {profile.name}", style="bold cyan")
         console.print(f"   {profile.description}", style="dim")
         console.print(f"   Günlük limit: ${profile.daily_limit:.2f}", style="cyan")
@@ -4,7 +4,36 @@ import asyncio
 import os
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
+
+try:
+    from .ai_cache import get_memory_response_cache
+except ImportError:
+    from ai_cache import get_memory_response_cache
+
+# Porcelain index-column codes (as byte values) that mean a change is staged
+_STAGED_STATUS_CODES = frozenset(b"MTADRCU")
+_UNCHANGED_CODE = ord(" ")
+
+# Branch header prefixes used before the first commit (older and newer Git)
+_UNBORN_BRANCH_PREFIXES = (b"No commits yet on ", b"Initial commit on ")
+
+# Failure detail for commands whose stderr goes straight to the terminal
+_PASSTHROUGH_ERROR_NOTE = "See git output above"
+
+
+def _parse_branch_header(header: bytes) -> str:
+    """Return the branch name from a ``git status --branch`` header.
+
+    The header looks like ``main...origin/main [ahead 1]``; a detached HEAD
+    gives an empty name, as ``git branch --show-current`` does.
+    """
+    for prefix in _UNBORN_BRANCH_PREFIXES:
+        if header.startswith(prefix):
+            return os.fsdecode(header[len(prefix) :])
+    if header.startswith(b"HEAD (no branch)"):
+        return ""
+    return os.fsdecode(header.split(b"...", 1)[0].split(b" ", 1)[0])
 
 
 class SimpleGitManager:
@@ -29,8 +58,21 @@ class SimpleGitManager:
 
         return None
 
-    async def _run_git_command(self, args: List[str]) -> Tuple[bool, str, str]:
-        """Run Git command asynchronously."""
+    async def _run_git_command(
+        self,
+        args: List[str],
+        decode: bool = True,
+        *,
+        capture_stdout: bool = True,
+        capture_stderr: bool = True,
+    ) -> Tuple[bool, Union[str, bytes], str]:
+        """Run Git command asynchronously.
+
+        With ``decode=False`` stdout is returned as raw bytes so callers can
+        parse large outputs without decoding them up front. Streams that are
+        not captured are passed through to the terminal instead of piped, and
+        come back as empty values.
+        """
         if not self.repo_path:
             return False, "", "Not in a Git repository"
 
@@ -40,14 +82,19 @@ class SimpleGitManager:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 cwd=self.repo_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE if capture_stdout else None,
+                stderr=asyncio.subprocess.PIPE if capture_stderr else None,
             )
 
             stdout, stderr = await process.communicate()
             success = process.returncode == 0
+            stdout = stdout or b""
 
-            return success, stdout.decode(), stderr.decode()
+            return (
+                success,
+                stdout.decode() if decode else stdout,
+                stderr.decode() if stderr else "",
+            )
 
         except Exception as e:
             return False, "", str(e)
@@ -58,35 +105,35 @@ class SimpleGitManager:
             return None
 
         try:
-            # Get branch name
-            success, branch_output, _ = await self._run_git_command(
-                ["branch", "--show-current"]
-            )
-            branch = branch_output.strip() if success else "unknown"
-
-            # Get status
+            # One process reports both the branch ("## ..." header) and files
             success, status_output, _ = await self._run_git_command(
-                ["status", "--porcelain"]
+                ["status", "--porcelain", "--branch"], decode=False
             )
             if not success:
                 return None
 
+            branch = "unknown"
+            if status_output.startswith(b"## "):
+                header, _, status_output = status_output.partition(b"\n")
+                branch = _parse_branch_header(header[3:])
+
             modified = []
             staged = []
             untracked = []
 
-            for line in status_output.strip().split("\n"):
-                if not line:
+            # Porcelain lines are "XY path"; only the path needs decoding
+            for line in status_output.splitlines():
+                if len(line) < 4:
                     continue
 
-                status_code = line[:2]
-                filename = line[3:]
+                index_code, worktree_code = line[0], line[1]
+                filename = os.fsdecode(line[3:])
 
-                if status_code[0] != " " and status_code[0] != "?":
+                if index_code in _STAGED_STATUS_CODES:
                     staged.append(filename)
-                if status_code[1] != " ":
+                if worktree_code != _UNCHANGED_CODE:
                     modified.append(filename)
-                if status_code == "??":
+                if line.startswith(b"??"):
                     untracked.append(filename)
 
             return {
@@ -101,25 +148,34 @@ class SimpleGitManager:
                 self.ui_manager.display_error("Git status failed", str(e))
             return None
 
-    async def commit_changes(self, message: str) -> bool:
-        """Commit all changes with message."""
+    async def commit_changes(self, message: str, status: Optional[dict] = None) -> bool:
+        """Commit all changes with message.
+
+        When a ``status`` from check_git_status shows no untracked files,
+        staging and committing run as a single ``git commit -am``.
+        """
         if not self.repo_path:
             if self.ui_manager:
                 self.ui_manager.display_error("Not in a Git repository")
             return False
 
         try:
-            # Stage all changes
-            success, _, error = await self._run_git_command(["add", "-A"])
-            if not success:
-                if self.ui_manager:
-                    self.ui_manager.display_error("Failed to stage changes", error)
-                return False
+            if status is not None and not status.get("untracked"):
+                success, output, error = await self._run_git_command(
+                    ["commit", "-am", message]
+                )
+            else:
+                # Stage all changes
+                success, _, error = await self._run_git_command(["add", "-A"])
+                if not success:
+                    if self.ui_manager:
+                        self.ui_manager.display_error("Failed to stage changes", error)
+                    return False
 
-            # Commit
-            success, output, error = await self._run_git_command(
-                ["commit", "-m", message]
-            )
+                # Commit
+                success, output, error = await self._run_git_command(
+                    ["commit", "-m", message]
+                )
 
             if success:
                 if self.ui_manager:
@@ -141,7 +197,9 @@ class SimpleGitManager:
             return False
 
         try:
-            success, output, error = await self._run_git_command(["push"])
+            success, output, error = await self._run_git_command(
+                ["push"], capture_stderr=False
+            )
 
             if success:
                 if self.ui_manager:
@@ -149,7 +207,9 @@ class SimpleGitManager:
                 return True
             else:
                 if self.ui_manager:
-                    self.ui_manager.display_error("Push failed", error)
+                    self.ui_manager.display_error(
+                        "Push failed", error or _PASSTHROUGH_ERROR_NOTE
+                    )
                 return False
 
         except Exception as e:
@@ -163,7 +223,9 @@ class SimpleGitManager:
             return False
 
         try:
-            success, output, error = await self._run_git_command(["pull"])
+            success, output, error = await self._run_git_command(
+                ["pull"], capture_stderr=False
+            )
 
             if success:
                 if self.ui_manager:
@@ -171,7 +233,9 @@ class SimpleGitManager:
                 return True
             else:
                 if self.ui_manager:
-                    self.ui_manager.display_error("Pull failed", error)
+                    self.ui_manager.display_error(
+                        "Pull failed", error or _PASSTHROUGH_ERROR_NOTE
+                    )
                 return False
 
         except Exception as e:
@@ -261,11 +325,22 @@ class SimpleGitManager:
                 files_info = f"Modified: {status.get('modified', [])}, Staged: {status.get('staged', [])}, Untracked: {status.get('untracked', [])}"
                 prompt = f"Generate a concise git commit message for these changes: {files_info}"
 
-                response = await ai_client.generate_response(prompt)
-                message = response.content.strip().split("\n")[0]  # First line only
+                # Key on file basenames so equivalent change sets share a message
+                response_cache = get_memory_response_cache()
+                changed_files = sorted(
+                    os.path.basename(name)
+                    for key in ("modified", "staged", "untracked")
+                    for name in status.get(key, [])
+                )
+                cache_key = response_cache.make_key("commit", *changed_files)
+                message = response_cache.get(cache_key)
+                if message is None:
+                    response = await ai_client.generate_response(prompt)
+                    message = response.content.strip().split("\n")[0]  # First line only
+                    response_cache.set(cache_key, message)
             except:
                 message = f"Smart CLI auto-commit: {total_changes} files changed"
         else:
             message = f"Smart CLI auto-commit: {total_changes} files changed"
 
-        return await self.commit_changes(message)
+        return await self.commit_changes(message, status)
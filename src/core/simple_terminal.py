@@ -1,10 +1,93 @@
 """Smart CLI Simple Terminal Manager - Essential command execution only."""
 
 import asyncio
+import codecs
 import os
+import re
+import shlex
 import subprocess
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+try:
+    from .ai_cache import get_memory_response_cache
+except ImportError:
+    from ai_cache import get_memory_response_cache
+
+# Upper bound on captured output per stream kept in CommandResult (1 MiB)
+MAX_CAPTURED_OUTPUT = 1024 * 1024
+
+# Bytes requested per read from a command's output pipes
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Common natural-language requests resolved without an AI round-trip
+_NL_SHORTCUTS = {
+    "list files": "ls -la",
+    "show files": "ls -la",
+    "check disk space": "df -h",
+    "show disk space": "df -h",
+    "disk usage": "df -h",
+    "find python files": 'find . -name "*.py"',
+    "current directory": "pwd",
+    "show current directory": "pwd",
+    "show processes": "ps aux",
+    "list processes": "ps aux",
+    "check memory": "free -h",
+    "show memory usage": "free -h",
+}
+
+# Looser phrasings of the same requests, matched against the whole input so
+# requests with extra qualifiers (paths, filters) still go to the AI
+_NL_SHORTCUT_PATTERNS = [
+    (
+        re.compile(
+            r"(?:how much|check|show)\s+(?:free\s+)?disk"
+            r"(?:\s+space)?(?:\s+is\s+(?:left|free))?"
+        ),
+        "df -h",
+    ),
+    (re.compile(r"(?:list|show)\s+(?:all\s+)?(?:the\s+)?files(?:\s+here)?"), "ls -la"),
+    (re.compile(r"find\s+(?:all\s+)?(?:the\s+)?python\s+files"), 'find . -name "*.py"'),
+    (re.compile(r"(?:list|show)\s+(?:all\s+)?(?:running\s+)?processes"), "ps aux"),
+]
+
+# Characters that need /bin/sh: operators, redirection, expansion and globbing
+_SHELL_METACHARACTERS = frozenset("|;&<>()`$*?[~#\n")
+
+# Quoted spans whose contents the shell passes through literally
+_LITERAL_QUOTED_RE = re.compile(r"'[^']*'|\"[^\"$`\\]*\"")
+
+# Numbered list items such as "1. ls -la" or "2) df -h"
+_NUMBERED_LIST_RE = re.compile(r"^\s*\d+[.)]\s*(.+?)\s*$")
+
+
+def _match_nl_shortcut(natural_command: str) -> Optional[str]:
+    """Return a known shell command for a natural-language request, if any."""
+    normalized = natural_command.casefold().strip()
+    shell_command = _NL_SHORTCUTS.get(normalized)
+    if shell_command:
+        return shell_command
+
+    for pattern, command in _NL_SHORTCUT_PATTERNS:
+        if pattern.fullmatch(normalized):
+            return command
+    return None
+
+
+def _split_simple_command(command: str) -> Optional[List[str]]:
+    """Split a command into argv if it can run without a shell, else None."""
+    unquoted = _LITERAL_QUOTED_RE.sub("", command)
+    if not _SHELL_METACHARACTERS.isdisjoint(unquoted):
+        return None
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        return None
+    # Leading VAR=value assignments are shell syntax
+    if not tokens or "=" in tokens[0]:
+        return None
+    return tokens
 
 
 @dataclass
@@ -37,44 +120,109 @@ class SimpleTerminalManager:
                 self.ui_manager.display_error("⚠️ Dangerous command blocked", command)
             return CommandResult(command, False, "", "Dangerous command blocked")
 
+        process = None
         try:
             if self.ui_manager:
                 self.ui_manager.console.print(f"🔧 [blue]Executing:[/blue] {command}")
 
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=self.current_directory,
-            )
+            process = await self._spawn(command)
 
-            stdout, stderr = await process.communicate()
+            # Drain both pipes concurrently; stdout is echoed as it arrives
+            output, error = await asyncio.gather(
+                self._read_stream(process.stdout, echo=True),
+                self._read_stream(process.stderr, echo=False),
+            )
+            await process.wait()
             success = process.returncode == 0
 
-            output = stdout.decode("utf-8", errors="ignore")
-            error = stderr.decode("utf-8", errors="ignore")
-
-            if self.ui_manager:
-                if success and output:
-                    self.ui_manager.console.print(
-                        f"✅ [green]Output:[/green]\n{output}"
-                    )
-                elif not success and error:
-                    self.ui_manager.console.print(f"❌ [red]Error:[/red]\n{error}")
+            if self.ui_manager and not success and error:
+                self.ui_manager.console.print(f"❌ [red]Error:[/red]\n{error}")
 
             return CommandResult(command, success, output, error)
 
         except Exception as e:
+            # Don't leave the child running with nobody draining its pipes
+            if process is not None and process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+
             error_msg = str(e)
             if self.ui_manager:
                 self.ui_manager.display_error("Command execution failed", error_msg)
             return CommandResult(command, False, "", error_msg)
 
+    async def _spawn(self, command: str) -> asyncio.subprocess.Process:
+        """Start a command, bypassing /bin/sh when no shell features are used."""
+        spawn_kwargs = dict(
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.current_directory,
+        )
+
+        argv = _split_simple_command(command)
+        if argv:
+            try:
+                return await asyncio.create_subprocess_exec(*argv, **spawn_kwargs)
+            except (FileNotFoundError, PermissionError):
+                # Shell builtins and missing programs: let the shell handle them
+                pass
+
+        return await asyncio.create_subprocess_shell(command, **spawn_kwargs)
+
+    async def _read_stream(self, stream, echo: bool) -> str:
+        """Read a process stream in chunks, keeping only the most recent output."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        chunks = deque()
+        stored = 0
+        pending = ""  # Unfinished line waiting to be echoed
+        header_shown = False
+
+        while True:
+            raw = await stream.read(_READ_CHUNK_SIZE)
+            text = decoder.decode(raw, final=not raw)
+
+            if echo and self.ui_manager:
+                pending += text
+                if raw and len(pending) <= MAX_CAPTURED_OUTPUT:
+                    # Hold back the unfinished last line until it completes
+                    lines, newline, pending = pending.rpartition("\n")
+                else:
+                    # At EOF, or for oversized unterminated output, echo it all
+                    lines, newline, pending = pending, bool(pending), ""
+                if newline:
+                    if not header_shown:
+                        self.ui_manager.console.print("✅ [green]Output:[/green]")
+                        header_shown = True
+                    self.ui_manager.console.print(lines, markup=False, highlight=False)
+
+            if text:
+                chunks.append(text)
+                stored += len(text)
+                while stored - len(chunks[0]) >= MAX_CAPTURED_OUTPUT:
+                    stored -= len(chunks.popleft())
+                if stored > MAX_CAPTURED_OUTPUT:
+                    chunks[0] = chunks[0][stored - MAX_CAPTURED_OUTPUT :]
+                    stored = MAX_CAPTURED_OUTPUT
+
+            if not raw:
+                return "".join(chunks)
+
     async def execute_with_ai_assistance(
         self, natural_command: str, ai_client=None
     ) -> CommandResult:
         """Convert natural language to shell command and execute."""
 
+        shortcut = _match_nl_shortcut(natural_command)
+        if shortcut:
+            if self.ui_manager:
+                self.ui_manager.console.print(
+                    f"📝 [green]Converted to:[/green] {shortcut}"
+                )
+            return await self.execute_command(shortcut)
+
         if not ai_client:
             return CommandResult(natural_command, False, "", "No AI client available")
 
@@ -94,8 +242,13 @@ Command:"""
                     "🤖 [blue]Converting to shell command...[/blue]"
                 )
 
-            response = await ai_client.generate_response(prompt)
-            shell_command = response.content.strip().split("\n")[0]
+            response_cache = get_memory_response_cache()
+            cache_key = response_cache.make_key("shell", natural_command)
+            shell_command = response_cache.get(cache_key)
+            if shell_command is None:
+                response = await ai_client.generate_response(prompt)
+                shell_command = response.content.strip().split("\n")[0]
+                response_cache.set(cache_key, shell_command)
 
             if self.ui_manager:
                 self.ui_manager.console.print(
@@ -112,27 +265,27 @@ Command:"""
 
     def change_directory(self, path: str) -> bool:
         """Change current working directory."""
+        # Keep the logical path (symlinks unresolved), as typed by the user
+        target = os.path.abspath(os.path.expanduser(path))
         try:
-            expanded_path = os.path.expanduser(path)
-            if os.path.isdir(expanded_path):
-                self.current_directory = os.path.abspath(expanded_path)
-                os.chdir(self.current_directory)
-
-                if self.ui_manager:
-                    self.ui_manager.console.print(
-                        f"📁 [green]Changed to:[/green] {self.current_directory}"
-                    )
-                return True
-            else:
-                if self.ui_manager:
-                    self.ui_manager.display_error(f"Directory not found: {path}")
-                return False
-
+            # Let chdir validate the path instead of a separate isdir check
+            os.chdir(target)
+        except (FileNotFoundError, NotADirectoryError):
+            if self.ui_manager:
+                self.ui_manager.display_error(f"Directory not found: {path}")
+            return False
         except Exception as e:
             if self.ui_manager:
                 self.ui_manager.display_error("Directory change failed", str(e))
             return False
 
+        self.current_directory = target
+        if self.ui_manager:
+            self.ui_manager.console.print(
+                f"📁 [green]Changed to:[/green] {self.current_directory}"
+            )
+        return True
+
     async def smart_command_suggestion(self, task: str, ai_client=None) -> list:
         """Get AI command suggestions for a task."""
 
@@ -147,17 +300,24 @@ Format as numbered list:
 3. command3"""
 
         try:
-            response = await ai_client.generate_response(prompt)
+            response_cache = get_memory_response_cache()
+            cache_key = response_cache.make_key("suggest", task)
+            content = response_cache.get(cache_key)
+            if content is None:
+                response = await ai_client.generate_response(prompt)
+                content = response.content
+                response_cache.set(cache_key, content)
+
             suggestions = []
 
-            for line in response.content.split("\n"):
-                line = line.strip()
-                if line and line[0].isdigit():
-                    cmd = line.split(".", 1)[-1].strip()
-                    if cmd:
-                        suggestions.append(cmd)
+            for line in content.splitlines():
+                match = _NUMBERED_LIST_RE.match(line)
+                if match:
+                    suggestions.append(match.group(1))
+                    if len(suggestions) == 3:  # Max 3 suggestions
+                        break
 
-            return suggestions[:3]  # Max 3 suggestions
+            return suggestions
 
         except Exception as e:
             if self.ui_manager:
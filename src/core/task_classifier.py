@@ -1,10 +1,16 @@
 """Smart Task Classification System - Determines optimal agent pipeline based on task complexity."""
 
+import functools
+import os
 import re
 from enum import Enum
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class TaskComplexity(Enum):
     """Task complexity levels for pipeline optimization."""
@@ -24,96 +30,315 @@ class TaskRisk(Enum):
     CRITICAL = "critical"  # Security, auth, database, payments
 
 
+# Risk levels that keep the lighter pipelines
+_LOW_OR_MEDIUM_RISK = frozenset({TaskRisk.LOW, TaskRisk.MEDIUM})
+
+_FULL_PIPELINE = ("analyzer", "architect", "modifier", "tester", "reviewer")
+
+
+def _pipeline_for(complexity: TaskComplexity, risk: TaskRisk) -> Tuple[str, ...]:
+    """Return the agent pipeline for one classification."""
+    if complexity == TaskComplexity.MICRO:
+        # Skip architect for simple changes
+        return ("modifier",)
+
+    if complexity == TaskComplexity.MEDIUM:
+        # Standard pipeline without full analysis
+        if risk in _LOW_OR_MEDIUM_RISK:
+            return ("architect", "modifier", "tester")
+        return ("analyzer", "architect", "modifier", "tester")
+
+    # Complex and critical tasks get the full pipeline with analysis
+    return _FULL_PIPELINE
+
+
+# Recommended pipeline for every (complexity, risk) pair
+_PIPELINE_TABLE: Dict[Tuple[TaskComplexity, TaskRisk], Tuple[str, ...]] = {
+    (complexity, risk): _pipeline_for(complexity, risk)
+    for complexity in TaskComplexity
+    for risk in TaskRisk
+}
+
+# Recommended models per agent, by risk level
+_MODEL_TABLE: Dict[TaskRisk, Dict[str, str]] = {
+    # Use expensive models for critical tasks
+    TaskRisk.CRITICAL: {
+        "analyzer": "claude-sonnet",
+        "architect": "claude-sonnet",
+        "modifier": "claude-sonnet",
+        "tester": "llama-3-70b",
+        "reviewer": "claude-sonnet",
+    },
+    # Mix of medium and expensive models
+    TaskRisk.HIGH: {
+        "analyzer": "llama-3-70b",
+        "architect": "claude-sonnet",
+        "modifier": "llama-3-70b",
+        "tester": "llama-3-70b",
+        "reviewer": "claude-sonnet",
+    },
+    # Mostly medium models
+    TaskRisk.MEDIUM: {
+        "analyzer": "llama-3-70b",
+        "architect": "llama-3-70b",
+        "modifier": "gpt-4o-mini",
+        "tester": "llama-3-8b",
+        "reviewer": "gpt-4o-mini",
+    },
+    # Cheap models for simple tasks
+    TaskRisk.LOW: {
+        "analyzer": "llama-3-8b",
+        "architect": "gpt-4o-mini",
+        "modifier": "llama-3-8b",
+        "tester": "llama-3-8b",
+        "reviewer": "claude-haiku",
+    },
+}
+
+# Critical risk patterns (security, auth, database)
+CRITICAL_PATTERNS = (
+    "auth",
+    "authentication",
+    "login",
+    "password",
+    "security",
+    "database",
+    "db",
+    "sql",
+    "migration",
+    "payment",
+    "crypto",
+    "secret",
+    "token",
+    "jwt",
+    "oauth",
+    "permission",
+    "role",
+)
+
+# High risk patterns (architecture, complex changes)
+HIGH_RISK_PATTERNS = (
+    "architecture",
+    "refactor",
+    "redesign",
+    "system design",
+    "multi-module",
+    "framework",
+    "integration",
+    "api design",
+    "performance",
+    "optimize",
+    "concurrency",
+    "async",
+)
+
+# Medium risk patterns (standard features)
+MEDIUM_RISK_PATTERNS = (
+    "feature",
+    "implement",
+    "create",
+    "build",
+    "develop",
+    "improve",
+    "enhance",
+    "update",
+    "modify",
+    "fix bug",
+    "add functionality",
+    "extend",
+)
+
+# Override patterns for low risk (even if they contain medium risk words)
+LOW_RISK_OVERRIDE_PATTERNS = (
+    "fix small",
+    "fix typo",
+    "fix text",
+    "small fix",
+    "minor fix",
+    "quick fix",
+    "simple fix",
+)
+
+# Low risk patterns (simple changes)
+LOW_RISK_PATTERNS = (
+    "text",
+    "docs",
+    "documentation",
+    "readme",
+    "comment",
+    "ui",
+    "style",
+    "css",
+    "html",
+    "formatting",
+    "lint",
+    "rename",
+    "move file",
+    "delete",
+)
+
+# File extensions by risk, shared by all classifier instances
+HIGH_RISK_FILES = frozenset({".sql", ".migration", ".env", ".config"})
+MEDIUM_RISK_FILES = frozenset({".py", ".js", ".ts", ".java", ".go", ".rs"})
+LOW_RISK_FILES = frozenset({".md", ".txt", ".html", ".css", ".json", ".yaml"})
+
+
+def _file_suffix(file_path: str) -> str:
+    """Return the lowercased extension, matching ``Path(file_path).suffix``."""
+    return os.path.splitext(file_path)[1].lower()
+
+
+@functools.lru_cache(maxsize=8)
+def _prefix_overlaps(patterns: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Map each pattern to the other patterns that share a start with it.
+
+    The regex fallback reports one pattern per position, so these are checked
+    explicitly to find every pattern that occurs, as the automaton does.
+    """
+    overlaps = {}
+    for pattern in patterns:
+        others = tuple(
+            other
+            for other in patterns
+            if other != pattern
+            and (other.startswith(pattern) or pattern.startswith(other))
+        )
+        if others:
+            overlaps[pattern] = others
+    return overlaps
+
+
+@functools.lru_cache(maxsize=8)
+def _build_pattern_matcher(
+    pattern_categories: Tuple[Tuple[str, str], ...], use_automaton: bool
+):
+    """Build a multi-pattern matcher over ``(pattern, category)`` pairs.
+
+    Uses a pyahocorasick automaton when available. Otherwise falls back to
+    one compiled regex whose lookahead alternation reports, at every
+    position, the highest-precedence pattern that starts there. Matchers
+    are shared between classifier instances with the same patterns.
+    """
+    if use_automaton:
+        automaton = ahocorasick.Automaton()
+        for pattern, category in pattern_categories:
+            automaton.add_word(pattern, (category, pattern))
+        automaton.make_automaton()
+        return automaton
+
+    alternation = "|".join(re.escape(pattern) for pattern, _ in pattern_categories)
+    return re.compile(f"(?=({alternation}))")
+
+
 class TaskClassifier:
     """Classifies tasks to determine optimal agent pipeline and model selection."""
 
     def __init__(self):
-        # Critical risk patterns (security, auth, database)
-        self.critical_patterns = [
-            "auth",
-            "authentication",
-            "login",
-            "password",
-            "security",
-            "database",
-            "db",
-            "sql",
-            "migration",
-            "payment",
-            "crypto",
-            "secret",
-            "token",
-            "jwt",
-            "oauth",
-            "permission",
-            "role",
-        ]
-
-        # High risk patterns (architecture, complex changes)
-        self.high_risk_patterns = [
-            "architecture",
-            "refactor",
-            "redesign",
-            "system design",
-            "multi-module",
-            "framework",
-            "integration",
-            "api design",
-            "performance",
-            "optimize",
-            "concurrency",
-            "async",
-        ]
-
-        # Medium risk patterns (standard features)
-        self.medium_risk_patterns = [
+        # Risk pattern tables are shared module constants
+        self.critical_patterns = CRITICAL_PATTERNS
+        self.high_risk_patterns = HIGH_RISK_PATTERNS
+        self.medium_risk_patterns = MEDIUM_RISK_PATTERNS
+        self.low_risk_override_patterns = LOW_RISK_OVERRIDE_PATTERNS
+        self.low_risk_patterns = LOW_RISK_PATTERNS
+
+        # Scope keywords used to estimate how many files a request touches.
+        # Matched at word starts so plurals ("classes") and compounds
+        # ("multi-module") count, without hits inside unrelated words.
+        self._multi_file_scope_re = self._compile_word_prefixes(
+            "project",
+            "application",
+            "system",
+            "multi",
+            "entire",
+            "full",
+            "complete",
+            "all files",
+            "whole",
+        )
+        self._medium_scope_re = self._compile_word_prefixes(
+            "module",
+            "component",
+            "service",
+            "package",
             "feature",
-            "implement",
-            "create",
-            "build",
-            "develop",
-            "improve",
-            "enhance",
-            "update",
-            "modify",
-            "fix bug",
-            "add functionality",
-            "extend",
-        ]
-
-        # Override patterns for low risk (even if they contain medium risk words)
-        self.low_risk_override_patterns = [
-            "fix small",
-            "fix typo",
-            "fix text",
-            "small fix",
-            "minor fix",
-            "quick fix",
-            "simple fix",
-        ]
-
-        # Low risk patterns (simple changes)
-        self.low_risk_patterns = [
+            "class",
+            "interface",
+            "api",
+        )
+        self._simple_scope_re = self._compile_word_prefixes(
+            "function",
+            "method",
+            "variable",
+            "fix",
+            "small",
+            "simple",
+            "quick",
+            "minor",
+            "typo",
             "text",
-            "docs",
-            "documentation",
-            "readme",
             "comment",
-            "ui",
-            "style",
-            "css",
-            "html",
-            "formatting",
-            "lint",
-            "rename",
-            "move file",
-            "delete",
-        ]
+        )
+        self._multi_file_factor_re = self._compile_word_prefixes(
+            "project", "system", "multi"
+        )
+        self._simple_factor_re = self._compile_word_prefixes("simple", "quick", "minor")
+
+        # Risk pattern groups in precedence order, scanned together in one pass
+        self._pattern_groups = (
+            ("override", self.low_risk_override_patterns),
+            ("critical", self.critical_patterns),
+            ("high", self.high_risk_patterns),
+            ("medium", self.medium_risk_patterns),
+            ("low", self.low_risk_patterns),
+        )
+        self._pattern_category: Dict[str, str] = {}
+        for category, patterns in self._pattern_groups:
+            for pattern in patterns:
+                self._pattern_category.setdefault(pattern, category)
+        self._pattern_matcher = _build_pattern_matcher(
+            tuple(self._pattern_category.items()), ahocorasick is not None
+        )
+        self._prefix_overlaps = (
+            _prefix_overlaps(tuple(self._pattern_category))
+            if isinstance(self._pattern_matcher, re.Pattern)
+            else {}
+        )
+        self._last_scan: Optional[Tuple[str, Dict[str, List[str]]]] = None
+
+        # Memoized classification keyed by (request_lower, context_key)
+        self._classify_cached = functools.lru_cache(maxsize=1024)(
+            self._classify_uncached
+        )
+
+    @staticmethod
+    def _compile_word_prefixes(*words: str) -> "re.Pattern[str]":
+        """Compile one regex matching any of ``words`` at the start of a word."""
+        return re.compile(r"\b(?:" + "|".join(map(re.escape, words)) + ")")
+
+    def _scan_patterns(self, request_lower: str) -> Dict[str, List[str]]:
+        """Return the risk patterns found in the request, grouped by category."""
+        # Read the shared slot once so a concurrent scan can't swap it mid-check
+        last = self._last_scan
+        if last is not None and last[0] == request_lower:
+            return last[1]
+
+        hits: Dict[str, List[str]] = {
+            category: [] for category, _ in self._pattern_groups
+        }
+        if not isinstance(self._pattern_matcher, re.Pattern):
+            for _, (category, pattern) in self._pattern_matcher.iter(request_lower):
+                hits[category].append(pattern)
+        else:
+            for match in self._pattern_matcher.finditer(request_lower):
+                pattern = match.group(1)
+                hits[self._pattern_category[pattern]].append(pattern)
+                start = match.start()
+                for other in self._prefix_overlaps.get(pattern, ()):
+                    if request_lower.startswith(other, start):
+                        hits[self._pattern_category[other]].append(other)
 
-        # File extensions by risk
-        self.high_risk_files = {".sql", ".migration", ".env", ".config"}
-        self.medium_risk_files = {".py", ".js", ".ts", ".java", ".go", ".rs"}
-        self.low_risk_files = {".md", ".txt", ".html", ".css", ".json", ".yaml"}
+        self._last_scan = (request_lower, hits)
+        return hits
 
     def classify_task(
         self, user_request: str, context: Optional[Dict] = None
@@ -128,7 +353,40 @@ class TaskClassifier:
         Returns:
             Tuple of (TaskComplexity, TaskRisk)
         """
-        request_lower = user_request.lower()
+        return self._classify_lowered(user_request.lower(), context)
+
+    def _classify_lowered(
+        self, request_lower: str, context: Optional[Dict]
+    ) -> Tuple[TaskComplexity, TaskRisk]:
+        """Classify an already lowercased request, using the cache when possible."""
+        context_key = self._context_key(context)
+        if context_key is None:
+            return self._classify_uncached(request_lower, context)
+        return self._classify_cached(request_lower, context_key)
+
+    @staticmethod
+    def _context_key(context: Optional[Dict]) -> Optional[Tuple]:
+        """Build a hashable cache key for a context dict, or None if not possible."""
+        if not context:
+            return ()
+        try:
+            key = tuple(
+                sorted(
+                    (name, tuple(value) if isinstance(value, list) else value)
+                    for name, value in context.items()
+                )
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _classify_uncached(
+        self, request_lower: str, context
+    ) -> Tuple[TaskComplexity, TaskRisk]:
+        """Classify a lowercased request; ``context`` may be a dict or a context key."""
+        if isinstance(context, tuple):
+            context = dict(context)
 
         # Determine risk level first
         risk = self._classify_risk(request_lower, context)
@@ -140,33 +398,33 @@ class TaskClassifier:
 
     def _classify_risk(self, request_lower: str, context: Optional[Dict]) -> TaskRisk:
         """Classify risk level based on patterns and context."""
+        hits = self._scan_patterns(request_lower)
 
         # Check for low-risk override patterns first
-        if any(pattern in request_lower for pattern in self.low_risk_override_patterns):
+        if hits["override"]:
             return TaskRisk.LOW
 
         # Check for critical patterns
-        if any(pattern in request_lower for pattern in self.critical_patterns):
+        if hits["critical"]:
             return TaskRisk.CRITICAL
 
         # Check for high-risk patterns
-        if any(pattern in request_lower for pattern in self.high_risk_patterns):
+        if hits["high"]:
             return TaskRisk.HIGH
 
         # Check file context if available
         if context and "file_paths" in context:
             file_paths = context["file_paths"]
             for file_path in file_paths:
-                file_ext = Path(file_path).suffix.lower()
-                if file_ext in self.high_risk_files:
+                if _file_suffix(file_path) in HIGH_RISK_FILES:
                     return TaskRisk.CRITICAL
 
         # Check for medium risk patterns
-        if any(pattern in request_lower for pattern in self.medium_risk_patterns):
+        if hits["medium"]:
             return TaskRisk.MEDIUM
 
         # Check for low risk patterns or default to medium
-        if any(pattern in request_lower for pattern in self.low_risk_patterns):
+        if hits["low"]:
             return TaskRisk.LOW
 
         return TaskRisk.MEDIUM  # Default fallback
@@ -194,7 +452,7 @@ class TaskClassifier:
         # Complexity classification
         if file_count <= 2 and risk == TaskRisk.LOW:
             return TaskComplexity.MICRO
-        elif file_count <= 2 and risk in [TaskRisk.LOW, TaskRisk.MEDIUM]:
+        elif file_count <= 2 and risk in _LOW_OR_MEDIUM_RISK:
             return TaskComplexity.MEDIUM
         elif file_count <= 10:
             return TaskComplexity.MEDIUM
@@ -205,55 +463,15 @@ class TaskClassifier:
         """Estimate number of files that will be affected."""
 
         # Multi-file indicators
-        if any(
-            word in request_lower
-            for word in [
-                "project",
-                "application",
-                "system",
-                "multi",
-                "entire",
-                "full",
-                "complete",
-                "all files",
-                "whole",
-            ]
-        ):
+        if self._multi_file_scope_re.search(request_lower):
             return 15  # Complex
 
         # Medium scope indicators
-        if any(
-            word in request_lower
-            for word in [
-                "module",
-                "component",
-                "service",
-                "package",
-                "feature",
-                "class",
-                "interface",
-                "api",
-            ]
-        ):
+        if self._medium_scope_re.search(request_lower):
             return 5  # Medium
 
         # Simple scope indicators
-        if any(
-            word in request_lower
-            for word in [
-                "function",
-                "method",
-                "variable",
-                "fix",
-                "small",
-                "simple",
-                "quick",
-                "minor",
-                "typo",
-                "text",
-                "comment",
-            ]
-        ):
+        if self._simple_scope_re.search(request_lower):
             return 1  # Micro
 
         return 3  # Default medium
@@ -262,78 +480,20 @@ class TaskClassifier:
         self, complexity: TaskComplexity, risk: TaskRisk
     ) -> List[str]:
         """Get recommended agent pipeline based on classification."""
-
-        if complexity == TaskComplexity.MICRO:
-            # Skip architect for simple changes
-            return ["modifier"]
-
-        elif complexity == TaskComplexity.MEDIUM:
-            # Standard pipeline without full analysis
-            if risk in [TaskRisk.LOW, TaskRisk.MEDIUM]:
-                return ["architect", "modifier", "tester"]
-            else:
-                return ["analyzer", "architect", "modifier", "tester"]
-
-        elif complexity == TaskComplexity.COMPLEX:
-            # Full pipeline with analysis
-            return ["analyzer", "architect", "modifier", "tester", "reviewer"]
-
-        elif complexity == TaskComplexity.CRITICAL:
-            # Full pipeline with extra scrutiny
-            return ["analyzer", "architect", "modifier", "tester", "reviewer"]
-
-        return ["modifier"]  # Fallback
+        return list(_PIPELINE_TABLE.get((complexity, risk), ("modifier",)))
 
     def get_recommended_models(
         self, complexity: TaskComplexity, risk: TaskRisk
     ) -> Dict[str, str]:
         """Get recommended models for each agent based on classification."""
-
-        if risk == TaskRisk.CRITICAL:
-            # Use expensive models for critical tasks
-            return {
-                "analyzer": "claude-sonnet",
-                "architect": "claude-sonnet",
-                "modifier": "claude-sonnet",
-                "tester": "llama-3-70b",
-                "reviewer": "claude-sonnet",
-            }
-
-        elif risk == TaskRisk.HIGH:
-            # Mix of medium and expensive models
-            return {
-                "analyzer": "llama-3-70b",
-                "architect": "claude-sonnet",
-                "modifier": "llama-3-70b",
-                "tester": "llama-3-70b",
-                "reviewer": "claude-sonnet",
-            }
-
-        elif risk == TaskRisk.MEDIUM:
-            # Mostly medium models
-            return {
-                "analyzer": "llama-3-70b",
-                "architect": "llama-3-70b",
-                "modifier": "gpt-4o-mini",
-                "tester": "llama-3-8b",
-                "reviewer": "gpt-4o-mini",
-            }
-
-        else:  # TaskRisk.LOW
-            # Cheap models for simple tasks
-            return {
-                "analyzer": "llama-3-8b",
-                "architect": "gpt-4o-mini",
-                "modifier": "llama-3-8b",
-                "tester": "llama-3-8b",
-                "reviewer": "claude-haiku",
-            }
+        return dict(_MODEL_TABLE.get(risk, _MODEL_TABLE[TaskRisk.LOW]))
 
     def create_classification_report(
         self, user_request: str, context: Optional[Dict] = None
     ) -> Dict:
         """Create detailed classification report for debugging."""
-        complexity, risk = self.classify_task(user_request, context)
+        request_lower = user_request.lower()
+        complexity, risk = self._classify_lowered(request_lower, context)
         pipeline = self.get_recommended_pipeline(complexity, risk)
         models = self.get_recommended_models(complexity, risk)
 
@@ -346,13 +506,13 @@ class TaskClassifier:
             "estimated_file_count": (
                 context.get("file_count", 0)
                 if context
-                else self._estimate_file_count(user_request.lower())
+                else self._estimate_file_count(request_lower)
             ),
             "reasoning": {
                 "complexity_factors": self._get_complexity_factors(
-                    user_request.lower(), context
+                    request_lower, context
                 ),
-                "risk_factors": self._get_risk_factors(user_request.lower(), context),
+                "risk_factors": self._get_risk_factors(request_lower, context),
             },
         }
 
@@ -362,11 +522,11 @@ class TaskClassifier:
         """Get factors that influenced complexity classification."""
         factors = []
 
-        if any(word in request_lower for word in ["project", "system", "multi"]):
+        if self._multi_file_factor_re.search(request_lower):
             factors.append("Multi-file scope detected")
         if context and context.get("file_count", 0) > 10:
             factors.append(f"High file count: {context['file_count']}")
-        if any(word in request_lower for word in ["simple", "quick", "minor"]):
+        if self._simple_factor_re.search(request_lower):
             factors.append("Simple scope indicators")
 
         return factors
@@ -375,19 +535,25 @@ class TaskClassifier:
         self, request_lower: str, context: Optional[Dict]
     ) -> List[str]:
         """Get factors that influenced risk classification."""
-        factors = []
-
-        for pattern in self.critical_patterns:
-            if pattern in request_lower:
-                factors.append(f"Critical pattern: {pattern}")
-
-        for pattern in self.high_risk_patterns:
-            if pattern in request_lower:
-                factors.append(f"High risk pattern: {pattern}")
+        # Reuse the scan made while classifying instead of searching again
+        hits = self._scan_patterns(request_lower)
+        critical_hits = set(hits["critical"])
+        high_hits = set(hits["high"])
+
+        factors = [
+            f"Critical pattern: {pattern}"
+            for pattern in self.critical_patterns
+            if pattern in critical_hits
+        ]
+        factors.extend(
+            f"High risk pattern: {pattern}"
+            for pattern in self.high_risk_patterns
+            if pattern in high_hits
+        )
 
         if context and "file_paths" in context:
             for file_path in context["file_paths"]:
-                if Path(file_path).suffix.lower() in self.high_risk_files:
+                if _file_suffix(file_path) in HIGH_RISK_FILES:
                     factors.append(f"High risk file: {file_path}")
 
         return factors
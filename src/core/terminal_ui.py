@@ -1,24 +1,49 @@
 """Smart CLI Terminal UI System - Full dashboard implementation based on UX specification."""
 
 import asyncio
+import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set
 
-from rich.align import Align
-from rich.columns import Columns
 from rich.console import Console
-from rich.layout import Layout
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
-from rich.table import Table
-from rich.text import Text
 
 console = Console()
 
+# Number of most recent events kept for the timeline
+MAX_EVENTS = 50
+
+# Pipeline phases in display order: (name, display name)
+PIPELINE_PHASES = (
+    ("analysis", "Analysis"),
+    ("architecture", "Architecture"),
+    ("implementation", "Implementation"),
+    ("testing", "Testing"),
+    ("review", "Review"),
+    ("metalearning", "Meta Learning"),
+)
+
+# Pipeline agents: (name, display name, emoji)
+PIPELINE_AGENTS = (
+    ("analyzer", "Code Analyzer", "🔍"),
+    ("architect", "System Architect", "🏗️"),
+    ("modifier", "Code Modifier", "🔧"),
+    ("tester", "Testing", "🧪"),
+    ("reviewer", "Code Review", "👁️"),
+    ("metalearning", "MetaLearning", "🧠"),
+)
+
+# Minimum delay between coalesced refreshes, in seconds (at most ~20/sec)
+REFRESH_INTERVAL = 0.05
+
+# Zero-padded two-digit strings for minute/second display
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class PhaseStatus(Enum):
     """Phase execution status."""
@@ -39,7 +64,14 @@ class AgentStatus(Enum):
     WAITING = "waiting"
 
 
-@dataclass
+# Summary icon for each finished phase state
+_PHASE_RESULT_ICONS = {
+    PhaseStatus.COMPLETED: "✅",
+    PhaseStatus.FAILED: "❌",
+}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PhaseInfo:
     """Information about a phase."""
 
@@ -51,7 +83,7 @@ class PhaseInfo:
     start_time: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentInfo:
     """Information about an agent."""
 
@@ -62,9 +94,10 @@ class AgentInfo:
     progress: int = 0
     metrics: Dict[str, Any] = field(default_factory=dict)
     current_task: str = ""
+    metrics_summary: str = ""  # "key: value | ..." rebuilt when metrics change
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EventInfo:
     """Information about a system event."""
 
@@ -75,6 +108,14 @@ class EventInfo:
     level: str = "info"  # info, warning, error
 
 
+def _format_mm_ss(seconds: float) -> str:
+    """Format elapsed seconds as MM:SS."""
+    minutes, secs = divmod(int(seconds), 60)
+    if minutes < 100:
+        return _PAD2[minutes] + ":" + _PAD2[secs]
+    return f"{minutes:02d}:{secs:02d}"
+
+
 class SmartTerminalUI:
     """Disabled terminal UI to prevent spam."""
 
@@ -82,114 +123,181 @@ class SmartTerminalUI:
         # Initialize minimal state to avoid breaking code
         self.project_name = project_name
         self.branch = branch
-        self.run_id = f"#{datetime.now().strftime('%Y-%m-%d-%H')}"
-        self.start_time = time.time()
+        self.run_id = time.strftime("#%Y-%m-%d-%H")
+        # Durations use the monotonic clock; only event timestamps are wall-clock
+        self.start_time = time.monotonic()
         self.layout = None
+        self.events: Deque[EventInfo] = deque(maxlen=MAX_EVENTS)
+
+        # Pipeline phases in display order, indexed by name for O(1) updates
+        self.phases: List[PhaseInfo] = [
+            PhaseInfo(name, display_name) for name, display_name in PIPELINE_PHASES
+        ]
+        self._phase_by_name: Dict[str, PhaseInfo] = {p.name: p for p in self.phases}
+
+        self.agents: Dict[str, AgentInfo] = {
+            name: AgentInfo(name, display_name, emoji)
+            for name, display_name, emoji in PIPELINE_AGENTS
+        }
+
+        # Names of running agents and phases, kept in step with their status
+        self._running_agents: Set[str] = set()
+        self._running_phases: Set[str] = set()
+
+        # Focus text only changes when a phase or agent does; reset on mutation
+        self._focus_content: Optional[str] = None
+
+        # Pending coalesced refresh, see _schedule_refresh
+        self._dirty = False
+        self._refresh_handle: Optional[asyncio.TimerHandle] = None
+
+    # Rendering is disabled to prevent terminal spam; these stay as no-ops
+    def setup_layout(self):
+        pass
 
-    # All UI methods disabled to prevent terminal spam
-    def setup_layout(self): pass
-    def update_header(self, model="", cache=True, concurrency=3, tty=True): pass
-    def update_progress(self): pass
-    def update_agents(self): pass  
-    def update_events(self): pass
-    def update_focus(self, title="", content=""): pass
-    def add_event(self, icon, agent, message, level="info"): pass
-    def start_phase(self, phase_name): pass
-    def update_phase_progress(self, phase_name, progress): pass
-    def complete_phase(self, phase_name, success=True): pass
-    def start_agent(self, agent_name, task=""): pass
-    def update_agent_progress(self, agent_name, progress, metrics=None): pass
-    def complete_agent(self, agent_name, success=True): pass
-    def refresh(self): pass
-    def render(self): return None
+    def update_header(self, model="", cache=True, concurrency=3, tty=True):
+        pass
+
+    def update_progress(self):
+        pass
+
+    def update_agents(self):
+        pass
+
+    def update_events(self):
+        pass
+
+    def update_focus(self, title="", content=""):
+        pass
 
     def _get_default_focus_content(self) -> str:
         """Get default content for focus panel."""
-        active_agents = [
-            a for a in self.agents.values() if a.status == AgentStatus.RUNNING
-        ]
-
-        if active_agents:
-            agent = active_agents[0]
-            return f"Active: {agent.display_name}\nTask: {agent.current_task}\nProgress: {agent.progress}%"
-        else:
-            running_phases = [p for p in self.phases if p.status == PhaseStatus.RUNNING]
-            if running_phases:
-                phase = running_phases[0]
-                return f"Phase: {phase.display_name}\nProgress: {phase.progress}%\nDuration: {phase.duration:.1f}s"
-            else:
-                return "System ready\nAwaiting tasks..."
+        if self._focus_content is None:
+            self._focus_content = self._build_default_focus_content()
+        return self._focus_content
+
+    def _build_default_focus_content(self) -> str:
+        if self._running_agents:
+            # First running agent in display order
+            agent = next(
+                a for a in self.agents.values() if a.name in self._running_agents
+            )
+            content = f"Active: {agent.display_name}\nTask: {agent.current_task}\nProgress: {agent.progress}%"
+            if agent.metrics_summary:
+                content += f"\nMetrics: {agent.metrics_summary}"
+            return content
+
+        if self._running_phases:
+            phase = next(p for p in self.phases if p.name in self._running_phases)
+            return f"Phase: {phase.display_name}\nProgress: {phase.progress}%\nDuration: {phase.duration:.1f}s"
+
+        return "System ready\nAwaiting tasks..."
+
+    def _schedule_refresh(self):
+        """Coalesce state changes into at most one refresh per REFRESH_INTERVAL."""
+        self._dirty = True
+        if self._refresh_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop; the change is picked up by the next refresh
+            return
+        self._refresh_handle = loop.call_later(REFRESH_INTERVAL, self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run the pending refresh if anything changed since the last one."""
+        self._refresh_handle = None
+        if self._dirty:
+            self._dirty = False
+            self.refresh()
 
     def add_event(self, icon: str, agent: str, message: str, level: str = "info"):
         """Add new event to the timeline."""
         event = EventInfo(
             timestamp=time.time(), icon=icon, agent=agent, message=message, level=level
         )
+        # Bounded deque drops the oldest event once MAX_EVENTS is reached
         self.events.append(event)
-
-        # Keep only last 50 events
-        if len(self.events) > 50:
-            self.events = self.events[-50:]
+        self._schedule_refresh()
 
     def start_phase(self, phase_name: str):
         """Start a phase."""
-        for phase in self.phases:
-            if phase.name == phase_name:
-                phase.status = PhaseStatus.RUNNING
-                phase.start_time = time.time()
-                self.add_event("🚀", "System", f"Starting {phase.display_name} phase")
-                break
+        phase = self._phase_by_name.get(phase_name)
+        if phase is None:
+            return
+        phase.status = PhaseStatus.RUNNING
+        self._running_phases.add(phase.name)
+        self._focus_content = None
+        phase.start_time = time.monotonic()
+        self.add_event("🚀", "System", f"Starting {phase.display_name} phase")
 
     def update_phase_progress(self, phase_name: str, progress: int):
         """Update phase progress."""
-        for phase in self.phases:
-            if phase.name == phase_name:
-                phase.progress = progress
-                if phase.start_time:
-                    phase.duration = time.time() - phase.start_time
-                break
+        phase = self._phase_by_name.get(phase_name)
+        if phase is None:
+            return
+        phase.progress = progress
+        self._focus_content = None
+        if phase.start_time is not None:
+            phase.duration = time.monotonic() - phase.start_time
+        self._schedule_refresh()
 
     def complete_phase(self, phase_name: str, success: bool = True):
         """Complete a phase."""
-        for phase in self.phases:
-            if phase.name == phase_name:
-                phase.status = PhaseStatus.COMPLETED if success else PhaseStatus.FAILED
-                phase.progress = 100 if success else phase.progress
-                if phase.start_time:
-                    phase.duration = time.time() - phase.start_time
-
-                icon = "✅" if success else "❌"
-                self.add_event(icon, "System", f"{phase.display_name} phase completed")
-                break
+        phase = self._phase_by_name.get(phase_name)
+        if phase is None:
+            return
+        phase.status = PhaseStatus.COMPLETED if success else PhaseStatus.FAILED
+        self._running_phases.discard(phase.name)
+        self._focus_content = None
+        phase.progress = 100 if success else phase.progress
+        if phase.start_time is not None:
+            phase.duration = time.monotonic() - phase.start_time
+
+        icon = "✅" if success else "❌"
+        self.add_event(icon, "System", f"{phase.display_name} phase completed")
 
     def start_agent(self, agent_name: str, task: str = ""):
         """Start an agent."""
-        if agent_name in self.agents:
-            agent = self.agents[agent_name]
-            agent.status = AgentStatus.RUNNING
-            agent.current_task = task
-            agent.progress = 0
-            self.add_event("⚡", agent.display_name, f"Starting: {task}")
+        agent = self.agents.get(agent_name)
+        if agent is None:
+            return
+        agent.status = AgentStatus.RUNNING
+        self._running_agents.add(agent.name)
+        self._focus_content = None
+        agent.current_task = task
+        agent.progress = 0
+        self.add_event("⚡", agent.display_name, f"Starting: {task}")
 
     def update_agent_progress(
         self, agent_name: str, progress: int, metrics: Dict[str, Any] = None
     ):
         """Update agent progress and metrics."""
-        if agent_name in self.agents:
-            agent = self.agents[agent_name]
-            agent.progress = progress
-            if metrics:
-                agent.metrics.update(metrics)
+        agent = self.agents.get(agent_name)
+        if agent is None:
+            return
+        agent.progress = progress
+        self._focus_content = None
+        if metrics:
+            agent.metrics.update(metrics)
+            agent.metrics_summary = " | ".join(
+                f"{key}: {value}" for key, value in agent.metrics.items()
+            )
+        self._schedule_refresh()
 
     def complete_agent(self, agent_name: str, success: bool = True):
         """Complete an agent."""
-        if agent_name in self.agents:
-            agent = self.agents[agent_name]
-            agent.status = AgentStatus.COMPLETED if success else AgentStatus.FAILED
-            agent.progress = 100 if success else agent.progress
+        agent = self.agents.get(agent_name)
+        if agent is None:
+            return
+        agent.status = AgentStatus.COMPLETED if success else AgentStatus.FAILED
+        self._running_agents.discard(agent.name)
+        self._focus_content = None
+        agent.progress = 100 if success else agent.progress
 
-            icon = "✅" if success else "❌"
-            self.add_event(icon, agent.display_name, "Task completed")
+        icon = "✅" if success else "❌"
+        self.add_event(icon, agent.display_name, "Task completed")
 
     def refresh(self):
         """Disabled to prevent terminal spam."""
@@ -201,17 +309,17 @@ class SmartTerminalUI:
 
     def create_final_summary(self) -> str:
         """Create final execution summary."""
-        total_duration = time.time() - self.start_time
+        total_duration = time.monotonic() - self.start_time
 
         summary_lines = [
-            f"🎉 Completed in {int(total_duration//60):02d}:{int(total_duration%60):02d}",
+            f"🎉 Completed in {_format_mm_ss(total_duration)}",
             "",
         ]
 
         # Phase summaries
         for phase in self.phases:
-            if phase.status in [PhaseStatus.COMPLETED, PhaseStatus.FAILED]:
-                status_icon = "✅" if phase.status == PhaseStatus.COMPLETED else "❌"
+            status_icon = _PHASE_RESULT_ICONS.get(phase.status)
+            if status_icon is not None:
                 summary_lines.append(
                     f"- {phase.display_name}: {phase.duration:02.0f}s {status_icon}"
                 )
@@ -1,14 +1,73 @@
 """Base Handler for Smart CLI command handlers."""
 
 import asyncio
+import functools
+import re
+import unicodedata
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from rich.console import Console
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Shared by every handler module so all output goes through one Console
 console = Console()
 
 
+def read_text_prefix(file_path: str, size: int) -> str:
+    """Read at most ``size`` characters from the start of a UTF-8 text file."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read(size)
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_text(text: str) -> str:
+    """Implementation of ``BaseHandler.normalize_input``."""
+    if text.isascii():
+        return text.lower()
+    return unicodedata.normalize("NFC", text).lower().replace("i\u0307", "i")
+
+
+@functools.lru_cache(maxsize=32)
+def _build_keyword_matcher(keywords: Tuple[str, ...], use_automaton: bool):
+    """Build a matcher over handler keywords, or None if there are none.
+
+    Uses a pyahocorasick automaton when available, otherwise one compiled
+    regex alternation so the scan still runs in C. Matchers are shared
+    between handlers with the same keywords.
+    """
+    if not keywords:
+        return None
+    keywords = [BaseHandler.normalize_input(keyword) for keyword in keywords]
+    if use_automaton:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+@functools.lru_cache(maxsize=256)
+def _is_coroutine_function(func) -> bool:
+    """Cached ``asyncio.iscoroutinefunction`` for plain functions."""
+    return asyncio.iscoroutinefunction(func)
+
+
+def _is_async_callable(func) -> bool:
+    """Return True if calling ``func`` produces a coroutine."""
+    # Key bound methods on their function so the cache never holds instances
+    target = getattr(func, "__func__", func)
+    try:
+        return _is_coroutine_function(target)
+    except TypeError:
+        return asyncio.iscoroutinefunction(func)
+
+
 class BaseHandler(ABC):
     """Abstract base class for Smart CLI handlers."""
 
@@ -39,15 +98,42 @@ class BaseHandler(ABC):
         """
         pass
 
-    def matches_input(self, user_input: str) -> bool:
-        """Check if user input matches this handler's keywords."""
-        lower_input = user_input.lower()
-        return any(keyword in lower_input for keyword in self.keywords)
+    @staticmethod
+    def normalize_input(text: str) -> str:
+        """Lowercase text for keyword matching.
+
+        Non-ASCII text is NFC-normalized first so decomposed letters match
+        precomposed keywords such as "büdcə", and the Azerbaijani capital
+        "İ" lowers to a plain "i". Results are cached, so every handler
+        that sees the same input reuses one normalized string.
+        """
+        return _normalize_text(text)
+
+    def matches_input(self, user_input: str, lower_input: Optional[str] = None) -> bool:
+        """Check if user input matches this handler's keywords.
+
+        Callers that already normalized the input with ``normalize_input``
+        can pass it as ``lower_input`` to avoid doing it again.
+        """
+        if lower_input is None:
+            lower_input = self.normalize_input(user_input)
+
+        # Keywords are fixed per handler, so the matcher is built once
+        if "_keyword_matcher" not in self.__dict__:
+            self._keyword_matcher = _build_keyword_matcher(
+                tuple(self.keywords), ahocorasick is not None
+            )
+        matcher = self._keyword_matcher
+        if matcher is None:
+            return False
+        if isinstance(matcher, re.Pattern):
+            return matcher.search(lower_input) is not None
+        return next(matcher.iter(lower_input), None) is not None
 
     async def safe_execute(self, func, *args, **kwargs) -> Any:
         """Safely execute async function with error handling."""
         try:
-            if asyncio.iscoroutinefunction(func):
+            if _is_async_callable(func):
                 return await func(*args, **kwargs)
             else:
                 return func(*args, **kwargs)
@@ -66,10 +152,13 @@ class BaseHandler(ABC):
                 f"🔧 [dim blue][{self.__class__.__name__}] {message}[/dim blue]"
             )
 
-    def extract_content_after_keyword(self, user_input: str, keyword: str) -> str:
+    def extract_content_after_keyword(
+        self, user_input: str, keyword: str, lower_input: Optional[str] = None
+    ) -> str:
         """Extract content that comes after a specific keyword."""
-        lower_input = user_input.lower()
-        if keyword in lower_input:
-            index = lower_input.find(keyword)
-            return user_input[index + len(keyword) :].strip()
-        return ""
+        if lower_input is None:
+            lower_input = user_input.lower()
+        index = lower_input.find(keyword)
+        if index == -1:
+            return ""
+        return user_input[index + len(keyword) :].strip()
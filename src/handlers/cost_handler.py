@@ -1,12 +1,99 @@
 """Cost Management Handler for Smart CLI."""
 
-from rich.console import Console
+import json
+import os
+import re
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
 from rich.panel import Panel
 from rich.table import Table
 
-from .base_handler import BaseHandler
-
-console = Console()
+from .base_handler import BaseHandler, console
+
+try:
+    from ..core.ai_cost_optimizer import get_cost_optimizer
+    from ..core.budget_profiles import get_profile_manager
+except ImportError:
+    from core.ai_cost_optimizer import get_cost_optimizer
+    from core.budget_profiles import get_profile_manager
+
+# Budget amount in a command, e.g. "cost set daily 10.00"
+_AMOUNT_RE = re.compile(r"(\d+(?:\.\d{1,2})?)")
+
+# Cost command categories and their trigger words, in dispatch priority order
+_COMMAND_CATEGORIES = (
+    ("profile", ("profile", "preset", "template")),
+    ("status", ("status", "report", "summary", "hesabat", "vəziyyət")),
+    ("set", ("set", "configure")),
+    ("limit", ("limit", "budget")),
+    ("optimize", ("optimization", "optimize", "suggest")),
+    ("pricing", ("models", "pricing", "price")),
+)
+
+# Zero-width lookahead so every occurrence is reported, even inside a longer
+# trigger word; the named group tells which category matched
+_COMMAND_CATEGORY_RE = re.compile(
+    "(?="
+    + "|".join(
+        f"(?P<{name}>{'|'.join(map(re.escape, words))})"
+        for name, words in _COMMAND_CATEGORIES
+    )
+    + ")"
+)
+
+
+# Static help for 'cost'
+_COST_HELP_LINES = (
+    "💰 [bold blue]Cost Management Commands:[/bold blue]",
+    "   • [cyan]cost status[/cyan] - Show current usage and budget status",
+    "   • [cyan]cost report[/cyan] - Detailed usage report",
+    "   • [cyan]cost models[/cyan] - Show model pricing information",
+    "   • [cyan]cost optimize[/cyan] - Get optimization suggestions",
+    "   • [cyan]cost budget[/cyan] - Show budget configuration",
+    "\n🔧 [bold blue]Budget Configuration:[/bold blue]",
+    "   • [cyan]cost set daily 15.00[/cyan] - Set daily limit to $15",
+    "   • [cyan]cost set monthly 300.00[/cyan] - Set monthly limit to $300",
+    "   • [cyan]cost set request 2.00[/cyan] - Set per-request limit to $2",
+    "   • [cyan]cost configure interactive[/cyan] - Interactive budget setup",
+    "\n📋 [bold blue]Budget Profiles:[/bold blue]",
+    "   • [cyan]cost profile list[/cyan] - Show available profiles",
+    "   • [cyan]cost profile set developer[/cyan] - Apply developer profile",
+    "   • [cyan]cost profile compare[/cyan] - Compare profile costs",
+    "\n💡 Smart CLI automatically selects cost-effective models for each task!",
+)
+
+# Static help for 'cost profile'
+_PROFILE_HELP_LINES = (
+    "📋 [bold blue]Budget Profile Commands:[/bold blue]",
+    "   • [cyan]cost profile list[/cyan] - Show all available profiles",
+    "   • [cyan]cost profile set developer[/cyan] - Apply developer profile",
+    "   • [cyan]cost profile compare[/cyan] - Compare profile costs",
+    "   • [cyan]cost profile recommend[/cyan] - Get profile recommendations",
+    "\n💡 Profiles automatically configure optimal budgets and models!",
+)
+
+# Static text for 'cost profile recommend'
+_PROFILE_RECOMMENDATION_LINES = (
+    "🧙‍♂️ [bold blue]Profile Recommendation Wizard[/bold blue]",
+    "\n❓ Based on your usage patterns:",
+    "   🟢 Light usage (1-5 requests/day) → Student Profile",
+    "   🟡 Regular usage (10-30 requests/day) → Developer Profile",
+    "   🟠 Heavy usage (50+ requests/day) → Freelancer/Startup Profile",
+    "   🔴 Enterprise usage (100+ requests/day) → Enterprise Profile",
+    "\n💡 [cyan]To set a profile: cost profile set [profile_name][/cyan]",
+)
+
+
+def _print_lines(lines: Sequence[str]):
+    """Print several markup lines with a single console call.
+
+    Each line is still parsed as its own markup, so an unbalanced tag in one
+    line cannot leak into the next.
+    """
+    console.print(*lines, sep="\n")
 
 
 class CostHandler(BaseHandler):
@@ -28,6 +115,16 @@ class CostHandler(BaseHandler):
             "məsrəf",
         ]
 
+    @cached_property
+    def cost_optimizer(self):
+        """Global cost optimizer, looked up on first use."""
+        return get_cost_optimizer()
+
+    @cached_property
+    def profile_manager(self):
+        """Global budget profile manager, looked up on first use."""
+        return get_profile_manager()
+
     async def handle(self, user_input: str) -> bool:
         """Handle cost management operations."""
         if not self._matches_cost_command(user_input):
@@ -39,64 +136,36 @@ class CostHandler(BaseHandler):
 
     def _matches_cost_command(self, user_input: str) -> bool:
         """Check if input matches cost management commands."""
-        lower_input = user_input.lower()
-
-        # Direct cost commands
-        cost_phrases = [
-            "cost status",
-            "budget status",
-            "usage report",
-            "spending report",
-            "cost limit",
-            "set budget",
-            "cost optimization",
-            "cost report",
-            "xərc hesabatı",
-            "büdcə vəziyyəti",
-            "məsrəf hesabatı",
-        ]
-
-        for phrase in cost_phrases:
-            if phrase in lower_input:
-                return True
-
-        # Single keywords in cost context
-        if any(keyword in lower_input for keyword in self.keywords):
-            return True
-
-        return False
+        # Every direct cost phrase ("cost status", "set budget", "xərc hesabatı",
+        # ...) contains one of the keywords, so the keyword matcher alone
+        # decides in a single pass over the input.
+        return self.matches_input(user_input)
 
     async def _process_cost_command(self, command: str):
         """Process cost management commands."""
-        lower_cmd = command.lower()
+        lower_cmd = self.normalize_input(command)
+        cost_optimizer = self.cost_optimizer
 
-        # Import cost optimizer
-        try:
-            from ..core.ai_cost_optimizer import get_cost_optimizer
-        except ImportError:
-            from core.ai_cost_optimizer import get_cost_optimizer
-        cost_optimizer = get_cost_optimizer()
+        # One scan finds every category present; dispatch by priority
+        categories = {m.lastgroup for m in _COMMAND_CATEGORY_RE.finditer(lower_cmd)}
 
         # Profile commands first (before generic 'set' detection)
-        if any(word in lower_cmd for word in ["profile", "preset", "template"]):
-            await self._handle_profile_commands(command)
+        if "profile" in categories:
+            await self._handle_profile_commands(command, lower_cmd)
 
-        elif any(
-            word in lower_cmd
-            for word in ["status", "report", "summary", "hesabat", "vəziyyət"]
-        ):
+        elif "status" in categories:
             await self._show_cost_status(cost_optimizer)
 
-        elif any(word in lower_cmd for word in ["limit", "set", "budget", "configure"]):
-            if "set" in lower_cmd or "configure" in lower_cmd:
-                await self._set_budget_limits(cost_optimizer, command)
-            else:
-                await self._configure_budget(cost_optimizer)
+        elif "set" in categories:
+            await self._set_budget_limits(cost_optimizer, command, lower_cmd)
+
+        elif "limit" in categories:
+            await self._configure_budget(cost_optimizer)
 
-        elif any(word in lower_cmd for word in ["optimization", "optimize", "suggest"]):
+        elif "optimize" in categories:
             await self._show_optimization_suggestions(cost_optimizer)
 
-        elif any(word in lower_cmd for word in ["models", "pricing", "price"]):
+        elif "pricing" in categories:
             await self._show_model_pricing(cost_optimizer)
 
         else:
@@ -186,53 +255,51 @@ class CostHandler(BaseHandler):
 
         suggestions = cost_optimizer.suggest_cost_optimization(agent_usage)
 
-        console.print("💡 [bold blue]Cost Optimization Suggestions:[/bold blue]")
-        for i, suggestion in enumerate(suggestions, 1):
-            console.print(f"   {i}. {suggestion}")
+        lines = ["💡 [bold blue]Cost Optimization Suggestions:[/bold blue]"]
+        lines.extend(
+            f"   {i}. {suggestion}" for i, suggestion in enumerate(suggestions, 1)
+        )
 
         # Additional tips
-        console.print("\n🎯 [bold]Pro Tips for Cost Reduction:[/bold]")
-        console.print("   • Use simpler models for basic tasks")
-        console.print("   • Enable aggressive caching for repeated operations")
-        console.print("   • Batch similar requests together")
-        console.print("   • Use local models for development/testing")
-        console.print("   • Set stricter daily limits for automatic control")
+        lines.extend(
+            [
+                "\n🎯 [bold]Pro Tips for Cost Reduction:[/bold]",
+                "   • Use simpler models for basic tasks",
+                "   • Enable aggressive caching for repeated operations",
+                "   • Batch similar requests together",
+                "   • Use local models for development/testing",
+                "   • Set stricter daily limits for automatic control",
+            ]
+        )
+        _print_lines(lines)
 
     async def _configure_budget(self, cost_optimizer):
         """Show current budget configuration."""
-        console.print("⚙️ [bold blue]Current Budget Configuration:[/bold blue]")
-        console.print(f"   Daily limit: ${cost_optimizer.budget.daily_limit:.2f}")
-        console.print(f"   Monthly limit: ${cost_optimizer.budget.monthly_limit:.2f}")
-        console.print(
-            f"   Per-request limit: ${cost_optimizer.budget.per_request_limit:.2f}"
-        )
-        console.print(
-            f"   Emergency reserve: ${cost_optimizer.budget.emergency_reserve:.2f}"
-        )
-
-        console.print("\n💡 [cyan]To change limits:[/cyan]")
-        console.print(
-            "   • [yellow]cost set daily 10.00[/yellow] - Set daily limit to $10"
-        )
-        console.print(
-            "   • [yellow]cost set monthly 200.00[/yellow] - Set monthly limit to $200"
-        )
-        console.print(
-            "   • [yellow]cost set request 1.00[/yellow] - Set per-request limit to $1"
-        )
-        console.print(
-            "   • [yellow]cost configure interactive[/yellow] - Interactive setup"
+        _print_lines(
+            [
+                "⚙️ [bold blue]Current Budget Configuration:[/bold blue]",
+                f"   Daily limit: ${cost_optimizer.budget.daily_limit:.2f}",
+                f"   Monthly limit: ${cost_optimizer.budget.monthly_limit:.2f}",
+                f"   Per-request limit: ${cost_optimizer.budget.per_request_limit:.2f}",
+                f"   Emergency reserve: ${cost_optimizer.budget.emergency_reserve:.2f}",
+                "\n💡 [cyan]To change limits:[/cyan]",
+                "   • [yellow]cost set daily 10.00[/yellow] - Set daily limit to $10",
+                "   • [yellow]cost set monthly 200.00[/yellow] - Set monthly limit to $200",
+                "   • [yellow]cost set request 1.00[/yellow] - Set per-request limit to $1",
+                "   • [yellow]cost configure interactive[/yellow] - Interactive setup",
+            ]
         )
 
-    async def _set_budget_limits(self, cost_optimizer, command: str):
+    async def _set_budget_limits(
+        self, cost_optimizer, command: str, command_lower: Optional[str] = None
+    ):
         """Set budget limits via command."""
-        import re
-
         # Parse command for limit type and amount
-        command_lower = command.lower()
+        if command_lower is None:
+            command_lower = self.normalize_input(command)
 
         # Extract amount (look for numbers with optional decimal)
-        amount_match = re.search(r"(\d+(?:\.\d{1,2})?)", command)
+        amount_match = _AMOUNT_RE.search(command)
         if not amount_match:
             console.print(
                 "❌ [red]Please specify an amount (e.g., 'cost set daily 10.00')[/red]"
@@ -317,83 +384,94 @@ class CostHandler(BaseHandler):
 
     async def _update_project_config(self, key: str, value: str):
         """Update project configuration in .smart/ directory."""
-        import os
-        import json
-        from pathlib import Path
-        from datetime import datetime
+        await self._update_project_config_many({key: value})
 
+    async def _update_project_config_many(self, updates: Dict[str, str]):
+        """Update several project settings with one read and one write."""
         smart_dir = Path(".smart")
         config_file = smart_dir / "budget.json"
-        
+
         # Create .smart directory if it doesn't exist
         if not smart_dir.exists():
-            console.print("📝 [blue]Creating .smart/ directory for project settings...[/blue]")
+            console.print(
+                "📝 [blue]Creating .smart/ directory for project settings...[/blue]"
+            )
             try:
                 smart_dir.mkdir()
                 console.print("✅ [green].smart/ directory created![/green]")
             except Exception as e:
                 console.print(f"❌ [red]Failed to create .smart/ directory: {e}[/red]")
                 return
-        
+
         # Load existing config or create new
         config = {}
         if config_file.exists():
             try:
-                with open(config_file, "r") as f:
-                    config = json.load(f)
+                config = json.loads(config_file.read_text(encoding="utf-8"))
             except Exception:
                 config = {}
-        
+
+        # Nothing to write if every setting already has its value
+        changed = {
+            key: value for key, value in updates.items() if config.get(key) != value
+        }
+        if not changed:
+            return
+
         # Update configuration
-        config[key] = value
+        config.update(changed)
         config["updated_at"] = str(datetime.now())
-        
+
         try:
-            with open(config_file, "w") as f:
-                json.dump(config, f, indent=2)
-            console.print(f"✅ [green]Budget setting updated in .smart/budget.json[/green]")
+            # Write a temporary file and swap it in so readers never see a
+            # partially written config
+            tmp_file = config_file.with_suffix(".json.tmp")
+            tmp_file.write_text(json.dumps(config, indent=2), encoding="utf-8")
+            os.replace(tmp_file, config_file)
+            if len(changed) == 1:
+                console.print(
+                    "✅ [green]Budget setting updated in .smart/budget.json[/green]"
+                )
+            else:
+                console.print(
+                    f"✅ [green]Updated {len(changed)} settings "
+                    "in .smart/budget.json[/green]"
+                )
         except Exception as e:
             console.print(f"❌ [red]Failed to update project config: {e}[/red]")
 
-
     async def _interactive_budget_setup(self, cost_optimizer):
         """Interactive budget configuration wizard."""
-        console.print("🧙‍♂️ [bold blue]Interactive Budget Setup Wizard[/bold blue]")
-        console.print("Current limits:")
-        console.print(f"   Daily: ${cost_optimizer.budget.daily_limit:.2f}")
-        console.print(f"   Monthly: ${cost_optimizer.budget.monthly_limit:.2f}")
-        console.print(f"   Per-request: ${cost_optimizer.budget.per_request_limit:.2f}")
-
-        console.print("\n💡 [cyan]Usage recommendations:[/cyan]")
-        console.print(
-            "   🟢 Light usage (few requests/day): Daily $2-5, Monthly $50-100"
-        )
-        console.print(
-            "   🟡 Medium usage (regular development): Daily $5-15, Monthly $100-300"
-        )
-        console.print(
-            "   🔴 Heavy usage (production/team): Daily $15-50, Monthly $300-1000"
+        _print_lines(
+            [
+                "🧙‍♂️ [bold blue]Interactive Budget Setup Wizard[/bold blue]",
+                "Current limits:",
+                f"   Daily: ${cost_optimizer.budget.daily_limit:.2f}",
+                f"   Monthly: ${cost_optimizer.budget.monthly_limit:.2f}",
+                f"   Per-request: ${cost_optimizer.budget.per_request_limit:.2f}",
+                "\n💡 [cyan]Usage recommendations:[/cyan]",
+                "   🟢 Light usage (few requests/day): Daily $2-5, Monthly $50-100",
+                "   🟡 Medium usage (regular development): Daily $5-15, Monthly $100-300",
+                "   🔴 Heavy usage (production/team): Daily $15-50, Monthly $300-1000",
+                "\n🔧 [yellow]To set new limits, use specific commands:[/yellow]",
+                "   • cost set daily 10.00",
+                "   • cost set monthly 200.00",
+                "   • cost set request 1.00",
+            ]
         )
 
-        console.print("\n🔧 [yellow]To set new limits, use specific commands:[/yellow]")
-        console.print("   • cost set daily 10.00")
-        console.print("   • cost set monthly 200.00")
-        console.print("   • cost set request 1.00")
-
-    async def _handle_profile_commands(self, command: str):
+    async def _handle_profile_commands(
+        self, command: str, command_lower: Optional[str] = None
+    ):
         """Handle profile-related commands."""
-        try:
-            from ..core.budget_profiles import UsageProfile, get_profile_manager
-        except ImportError:
-            from core.budget_profiles import UsageProfile, get_profile_manager
-
-        profile_manager = get_profile_manager()
-        command_lower = command.lower()
+        profile_manager = self.profile_manager
+        if command_lower is None:
+            command_lower = self.normalize_input(command)
 
         if "list" in command_lower or "show" in command_lower:
             await self._show_budget_profiles(profile_manager)
         elif "set" in command_lower or "apply" in command_lower:
-            await self._apply_budget_profile(profile_manager, command)
+            await self._apply_budget_profile(profile_manager, command, command_lower)
         elif "compare" in command_lower:
             await self._compare_profiles(profile_manager)
         elif "recommend" in command_lower:
@@ -428,12 +506,14 @@ class CostHandler(BaseHandler):
             "\n💡 [cyan]To apply a profile: cost profile set developer[/cyan]"
         )
 
-    async def _apply_budget_profile(self, profile_manager, command: str):
+    async def _apply_budget_profile(
+        self, profile_manager, command: str, command_lower: Optional[str] = None
+    ):
         """Apply a budget profile."""
-        import re
-
         # Extract profile name from command
-        words = command.lower().split()
+        if command_lower is None:
+            command_lower = self.normalize_input(command)
+        words = command_lower.split()
         profile_name = None
 
         # Look for profile name after 'set' or 'apply'
@@ -456,7 +536,7 @@ class CostHandler(BaseHandler):
             # Find the matching UsageProfile enum
             profile_enum = None
             for p_type, p_profile in profile_manager.list_profiles().items():
-                if p_profile.name.lower() == profile_name.lower():
+                if p_profile.name.lower() == profile_name:
                     profile_enum = p_type
                     break
 
@@ -464,14 +544,13 @@ class CostHandler(BaseHandler):
                 raise ValueError(f"Profile '{profile_name}' not found")
 
             # Apply profile to session manager if available
-            if hasattr(self.smart_cli, 'session_manager'):
-                self.smart_cli.session_manager.set_budget_profile(profile_enum)
+            if self.session_manager is not None:
+                self.session_manager.set_budget_profile(profile_enum)
 
             env_vars = profile_manager.apply_profile(profile_enum)
 
             # Update environment variables
-            for key, value in env_vars.items():
-                await self._update_project_config(key, value)
+            await self._update_project_config_many(env_vars)
 
             console.print(f"✅ [green]Applied '{profile.name}' budget profile![/green]")
             console.print(f"   Daily limit: ${profile.daily_limit:.2f}")
@@ -507,63 +586,12 @@ class CostHandler(BaseHandler):
 
     async def _recommend_profile(self, profile_manager):
         """Recommend a profile based on usage patterns."""
-        console.print("🧙‍♂️ [bold blue]Profile Recommendation Wizard[/bold blue]")
-        console.print("\n❓ Based on your usage patterns:")
-        console.print("   🟢 Light usage (1-5 requests/day) → Student Profile")
-        console.print("   🟡 Regular usage (10-30 requests/day) → Developer Profile")
-        console.print(
-            "   🟠 Heavy usage (50+ requests/day) → Freelancer/Startup Profile"
-        )
-        console.print("   🔴 Enterprise usage (100+ requests/day) → Enterprise Profile")
-
-        console.print(
-            "\n💡 [cyan]To set a profile: cost profile set [profile_name][/cyan]"
-        )
+        _print_lines(_PROFILE_RECOMMENDATION_LINES)
 
     async def _show_profile_help(self):
         """Show profile management help."""
-        console.print("📋 [bold blue]Budget Profile Commands:[/bold blue]")
-        console.print(
-            "   • [cyan]cost profile list[/cyan] - Show all available profiles"
-        )
-        console.print(
-            "   • [cyan]cost profile set developer[/cyan] - Apply developer profile"
-        )
-        console.print("   • [cyan]cost profile compare[/cyan] - Compare profile costs")
-        console.print(
-            "   • [cyan]cost profile recommend[/cyan] - Get profile recommendations"
-        )
-        console.print(
-            "\n💡 Profiles automatically configure optimal budgets and models!"
-        )
+        _print_lines(_PROFILE_HELP_LINES)
 
     async def _show_cost_help(self):
         """Show cost management help."""
-        console.print("💰 [bold blue]Cost Management Commands:[/bold blue]")
-        console.print(
-            "   • [cyan]cost status[/cyan] - Show current usage and budget status"
-        )
-        console.print("   • [cyan]cost report[/cyan] - Detailed usage report")
-        console.print("   • [cyan]cost models[/cyan] - Show model pricing information")
-        console.print("   • [cyan]cost optimize[/cyan] - Get optimization suggestions")
-        console.print("   • [cyan]cost budget[/cyan] - Show budget configuration")
-        console.print("\n🔧 [bold blue]Budget Configuration:[/bold blue]")
-        console.print("   • [cyan]cost set daily 15.00[/cyan] - Set daily limit to $15")
-        console.print(
-            "   • [cyan]cost set monthly 300.00[/cyan] - Set monthly limit to $300"
-        )
-        console.print(
-            "   • [cyan]cost set request 2.00[/cyan] - Set per-request limit to $2"
-        )
-        console.print(
-            "   • [cyan]cost configure interactive[/cyan] - Interactive budget setup"
-        )
-        console.print("\n📋 [bold blue]Budget Profiles:[/bold blue]")
-        console.print("   • [cyan]cost profile list[/cyan] - Show available profiles")
-        console.print(
-            "   • [cyan]cost profile set developer[/cyan] - Apply developer profile"
-        )
-        console.print("   • [cyan]cost profile compare[/cyan] - Compare profile costs")
-        console.print(
-            "\n💡 Smart CLI automatically selects cost-effective models for each task!"
-        )
+        _print_lines(_COST_HELP_LINES)
@@ -1,17 +1,24 @@
 """File Operations Handler for Smart CLI."""
 
+import asyncio
 import os
+from typing import Dict, Tuple
 
-from rich.console import Console
+from .base_handler import BaseHandler, console, read_text_prefix
 
-from .base_handler import BaseHandler
-
-console = Console()
+# Characters of a document included in the analysis prompt
+ANALYSIS_PREFIX_CHARS = 3000
 
 
 class FileHandler(BaseHandler):
     """Handler for file operations like read, show, display."""
 
+    def __init__(self, smart_cli_instance):
+        """Initialize handler with an empty document analysis cache."""
+        super().__init__(smart_cli_instance)
+        # AI analyses by document path: (mtime_ns, size, response text)
+        self._doc_analysis_cache: Dict[str, Tuple[int, int, str]] = {}
+
     @property
     def keywords(self) -> list[str]:
         """Keywords that trigger file operations."""
@@ -19,12 +26,12 @@ class FileHandler(BaseHandler):
 
     async def handle(self, user_input: str) -> bool:
         """Handle file operations."""
-        if not self.matches_input(user_input):
+        lower_input = self.normalize_input(user_input)
+        if not self.matches_input(user_input, lower_input):
             return False
 
         self.log_debug(f"Processing file operation: {user_input}")
 
-        lower_input = user_input.lower()
         file_path = self.smart_cli.file_manager.extract_file_path(user_input)
 
         if file_path:
@@ -43,24 +50,37 @@ class FileHandler(BaseHandler):
 
     async def _analyze_technical_document(self, file_path: str):
         """Analyze technical document for coding implementation."""
+        # Reuse the previous analysis while the document is unchanged
+        try:
+            st = os.stat(file_path)
+        except OSError as e:
+            console.print(f"❌ Document analysis failed: {e}", style="red")
+            return
+        cached = self._doc_analysis_cache.get(file_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            console.print("📋 [bold green]Technical Analysis:[/bold green]")
+            self.ui_manager.display_ai_response(cached[2], "Code Analyzer")
+            return
+
         try:
             # Start analysis task
             analysis_task_id = self.ui_manager.start_task(
                 "doc_analysis", f"Sənəd analizi: {file_path}"
             )
 
-            # Read document content
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Only the prompt prefix is needed; read it off the event loop
+            content = await asyncio.to_thread(
+                read_text_prefix, file_path, ANALYSIS_PREFIX_CHARS
+            )
 
             self.ui_manager.update_task(
-                analysis_task_id, "in_progress", f"Oxundu: {len(content)} simvol"
+                analysis_task_id, "in_progress", f"Oxundu: {st.st_size} bayt"
             )
 
             analysis_prompt = f"""
 Sənədin məzmununa əsasən koder kimi cavab ver:
 
-SƏNƏD: {content[:3000]}...
+SƏNƏD: {content}...
 
 Bu sənəddə təsvir edilən sistemi tətbiq etmək üçün:
 1. Hansı Python faylları yaratmalıyam?
@@ -83,6 +103,12 @@ QISA VƏ KONKRET CAVAB VER - kod plan kimi."""
             console.print("📋 [bold green]Technical Analysis:[/bold green]")
             self.ui_manager.display_ai_response(response.content, "Code Analyzer")
 
+            self._doc_analysis_cache[file_path] = (
+                st.st_mtime_ns,
+                st.st_size,
+                response.content,
+            )
+
         except Exception as e:
             self.ui_manager.update_task(analysis_task_id, "failed", f"Xəta: {e}")
             console.print(f"❌ Document analysis failed: {e}", style="red")
@@ -2,11 +2,7 @@
 
 import time
 
-from rich.console import Console
-
-from .base_handler import BaseHandler
-
-console = Console()
+from .base_handler import BaseHandler, console
 
 
 class GitHandler(BaseHandler):
@@ -47,7 +43,7 @@ class GitHandler(BaseHandler):
 
     async def _process_git_command(self, command: str):
         """Process specific Git commands."""
-        lower_cmd = command.lower()
+        lower_cmd = self.normalize_input(command)
 
         if "status" in lower_cmd:
             await self._handle_git_status()
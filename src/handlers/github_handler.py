@@ -1,10 +1,6 @@
 """GitHub Operations Handler for Smart CLI."""
 
-from rich.console import Console
-
-from .base_handler import BaseHandler
-
-console = Console()
+from .base_handler import BaseHandler, console
 
 
 class GitHubHandler(BaseHandler):
@@ -46,7 +42,7 @@ class GitHubHandler(BaseHandler):
 
     async def _process_github_command(self, command: str):
         """Process GitHub commands with interactive interface."""
-        lower_cmd = command.lower()
+        lower_cmd = self.normalize_input(command)
 
         try:
             if "dashboard" in lower_cmd:
@@ -1,13 +1,40 @@
 """Implementation Handler for Smart CLI - AI-powered code generation."""
 
+import asyncio
 import os
 import re
 
-from rich.console import Console
+from .base_handler import BaseHandler, console, read_text_prefix
 
-from .base_handler import BaseHandler
+# Characters of each markdown document included in the implementation prompt
+DOC_PREFIX_CHARS = 3000
 
-console = Console()
+# Patterns for extracting (filename, code) pairs from an AI response, tried in
+# order until one matches
+_FILE_PATTERNS = tuple(
+    re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for pattern in (
+        # Pattern 1: FILENAME: xxx CODE: ```python ... ```
+        r"FILENAME:\s*([^\n\r]+)\s*CODE:\s*```(?:python|text|markdown)?\s*(.*?)```",
+        # Pattern 2: ## filename.py ```python ... ```
+        r"##\s*([^\n\r]+\.(?:py|txt|md))\s*```(?:python|text|markdown)?\s*(.*?)```",
+        # Pattern 3: **filename.py** ```python ... ```
+        r"\*\*([^\n\r]+\.(?:py|txt|md))\*\*\s*```(?:python|text|markdown)?\s*(.*?)```",
+        # Pattern 4: filename.py: ```python ... ```
+        r"([^\n\r]+\.(?:py|txt|md)):\s*```(?:python|text|markdown)?\s*(.*?)```",
+        # Pattern 5: Simple ```python blocks with preceding filename
+        r"([a-zA-Z_][a-zA-Z0-9_]*\.(?:py|txt|md))\s*```(?:python|text|markdown)?\s*(.*?)```",
+    )
+)
+
+# Any fenced code block, used when no filename pattern matches
+_CODE_BLOCK_RE = re.compile(r"```(?:python)?\s*(.*?)```", re.DOTALL)
+
+
+def _write_text_file(filename: str, code: str) -> None:
+    """Write code to filename as UTF-8, replacing any existing file."""
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(code)
 
 
 class ImplementationHandler(BaseHandler):
@@ -148,16 +175,29 @@ Generate all necessary files for a complete implementation.
         """Read all available project documentation."""
         docs = []
         try:
-            for file in os.listdir("."):
-                if file.endswith(".md"):
-                    try:
-                        with open(file, "r", encoding="utf-8") as f:
-                            content = f.read()
-                            docs.append(f"=== {file} ===\\n{content[:3000]}...")
-                    except Exception as e:
-                        self.log_debug(f"Could not read {file}: {e}")
+            with os.scandir(".") as entries:
+                files = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                ]
         except Exception as e:
             self.log_debug(f"Error reading directory: {e}")
+            return docs
+
+        # Read the prompt prefix of every document concurrently, off the loop
+        contents = await asyncio.gather(
+            *(
+                asyncio.to_thread(read_text_prefix, file, DOC_PREFIX_CHARS)
+                for file in files
+            ),
+            return_exceptions=True,
+        )
+        for file, content in zip(files, contents):
+            if isinstance(content, Exception):
+                self.log_debug(f"Could not read {file}: {content}")
+            else:
+                docs.append(f"=== {file} ===\\n{content}...")
 
         return docs
 
@@ -166,40 +206,25 @@ Generate all necessary files for a complete implementation.
         try:
             files_created = []
 
-            # Try multiple parsing patterns to extract code blocks
-            patterns = [
-                # Pattern 1: FILENAME: xxx CODE: ```python ... ```
-                r"FILENAME:\s*([^\n\r]+)\s*CODE:\s*```(?:python|text|markdown)?\s*(.*?)```",
-                # Pattern 2: ## filename.py ```python ... ```
-                r"##\s*([^\n\r]+\.(?:py|txt|md))\s*```(?:python|text|markdown)?\s*(.*?)```",
-                # Pattern 3: **filename.py** ```python ... ```
-                r"\*\*([^\n\r]+\.(?:py|txt|md))\*\*\s*```(?:python|text|markdown)?\s*(.*?)```",
-                # Pattern 4: filename.py: ```python ... ```
-                r"([^\n\r]+\.(?:py|txt|md)):\s*```(?:python|text|markdown)?\s*(.*?)```",
-                # Pattern 5: Simple ```python blocks with preceding filename
-                r"([a-zA-Z_][a-zA-Z0-9_]*\.(?:py|txt|md))\s*```(?:python|text|markdown)?\s*(.*?)```",
-            ]
-
             # Try each pattern
             matches = []
-            for pattern in patterns:
-                found = re.findall(pattern, ai_response, re.DOTALL | re.IGNORECASE)
+            for pattern in _FILE_PATTERNS:
+                found = pattern.findall(ai_response)
                 if found:
                     matches.extend(found)
                     break
 
             if not matches:
                 # Fallback: Look for any code blocks and create generic files
-                code_blocks = re.findall(
-                    r"```(?:python)?\s*(.*?)```", ai_response, re.DOTALL
-                )
+                code_blocks = _CODE_BLOCK_RE.findall(ai_response)
                 if code_blocks:
                     for i, code in enumerate(code_blocks):
                         if len(code.strip()) > 50:  # Only substantial code blocks
                             filename = f"generated_file_{i+1}.py"
                             matches.append((filename, code))
 
-            # Create files
+            # Clean names; a file named twice keeps its last code block
+            files = {}
             for filename, code in matches:
                 filename = filename.strip()
                 code = code.strip()
@@ -215,35 +240,39 @@ Generate all necessary files for a complete implementation.
                 elif filename.endswith(".gitignore.py"):
                     filename = filename.replace(".gitignore.py", ".gitignore")
 
-                # Create the file
-                try:
-                    with open(filename, "w", encoding="utf-8") as f:
-                        f.write(code)
+                files[filename] = code
 
-                    files_created.append(filename)
-                    console.print(f"✅ [green]Created: {filename}[/green]")
-                except Exception as file_error:
+            # Create the files concurrently, off the event loop
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(_write_text_file, filename, code)
+                    for filename, code in files.items()
+                ),
+                return_exceptions=True,
+            )
+            for (filename, code), file_error in zip(files.items(), results):
+                if isinstance(file_error, Exception):
                     console.print(
                         f"❌ [red]Failed to create {filename}: {file_error}[/red]"
                     )
+                else:
+                    files_created.append((filename, code))
+                    console.print(f"✅ [green]Created: {filename}[/green]")
 
             if files_created:
                 console.print(
                     f"🎉 [bold green]Successfully created {len(files_created)} files![/bold green]"
                 )
                 console.print("📁 Created files:", style="blue")
-                for f in files_created:
+                for f, _ in files_created:
                     console.print(f"   • {f}", style="cyan")
 
                 # Show file contents summary
                 console.print("\\n📋 [blue]File Contents Summary:[/blue]")
-                for f in files_created:
-                    try:
-                        with open(f, "r", encoding="utf-8") as file:
-                            lines = len(file.readlines())
-                        console.print(f"   • {f}: {lines} lines", style="cyan")
-                    except:
-                        pass
+                for f, code in files_created:
+                    # Count lines from the content just written, not a re-read
+                    lines = code.count("\n") + (1 if code and code[-1] != "\n" else 0)
+                    console.print(f"   • {f}: {lines} lines", style="cyan")
             else:
                 console.print(
                     "⚠️ [yellow]No files could be extracted from AI response[/yellow]"
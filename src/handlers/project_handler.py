@@ -2,11 +2,13 @@
 
 import re
 
-from rich.console import Console
-
 from .base_handler import BaseHandler
 
-console = Console()
+# Project name in quotes, e.g. create fastapi project "shop-api"
+_QUOTED_NAME_RE = re.compile(r'["\']([^"\']+)["\']')
+
+# Characters replaced with "-" in generated project names
+_PROJECT_NAME_INVALID_RE = re.compile(r"[^a-zA-Z0-9\\-_]")
 
 
 class ProjectHandler(BaseHandler):
@@ -45,7 +47,7 @@ class ProjectHandler(BaseHandler):
 
     async def _process_project_generation(self, request: str):
         """Process project generation requests."""
-        lower_request = request.lower()
+        lower_request = self.normalize_input(request)
 
         # Show available templates
         if any(
@@ -66,7 +68,7 @@ class ProjectHandler(BaseHandler):
             project_name = f"smart-cli-{template_name}-project"
 
         # Clean project name
-        project_name = re.sub(r"[^a-zA-Z0-9\\-_]", "-", project_name).lower()
+        project_name = _PROJECT_NAME_INVALID_RE.sub("-", project_name).lower()
 
         # Create project
         await self._create_project(template_name, project_name)
@@ -95,13 +97,14 @@ class ProjectHandler(BaseHandler):
     def _extract_project_name(self, request: str) -> str:
         """Extract project name from request."""
         # Try to find quoted project name
-        quoted_match = re.search(r'["\']([^"\']+)["\']', request)
+        quoted_match = _QUOTED_NAME_RE.search(request)
         if quoted_match:
             return quoted_match.group(1)
 
         # Try to find project name after "called" or "named"
+        lower_request = self.normalize_input(request)
         for word in ["called", "named", "adlandı"]:
-            if word in request.lower():
+            if word in lower_request:
                 parts = request.split(word, 1)
                 if len(parts) > 1:
                     project_name = parts[1].strip().split()[0]
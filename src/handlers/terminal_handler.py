@@ -1,11 +1,87 @@
 """Terminal Operations Handler for Smart CLI."""
 
-from rich.console import Console
-from rich.table import Table
+import re
 
-from .base_handler import BaseHandler
+from rich.table import Table
 
-console = Console()
+from .base_handler import BaseHandler, console
+
+
+def _compile_any(words) -> "re.Pattern[str]":
+    """Compile one regex matching any of ``words`` as a substring."""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Questions that should go to the AI instead of the shell
+_AI_QUESTION_RE = _compile_any(
+    [
+        "what is",
+        "what are",
+        "explain",
+        "difference between",
+        "how to",
+        "why",
+        "when",
+        "where",
+        "necə",
+        "niyə",
+        "nə vaxt",
+    ]
+)
+
+# Input that starts with a common shell command, alone or followed by a space
+_SHELL_COMMAND_START_RE = re.compile(
+    "(?:"
+    + "|".join(
+        ["ls", "pwd", "cd", "cat", "grep", "find", "python3", "node", "npm", "pip"]
+    )
+    + r")(?: |\Z)"
+)
+
+# Explicit requests to run something
+_RUN_VERB_RE = _compile_any(["run", "execute", "işlet", "çalıştır"])
+
+# Run verbs that introduce a command, in the order they are tried
+_RUN_PREFIXES = ("run ", "execute ", "işlet ", "çalıştır ")
+
+# Command names that make a run request a terminal command
+_COMMAND_MENTION_RE = _compile_any(["ls", "pwd", "python", "node", "npm", "git"])
+
+# Prefixes of input that is already a shell command and runs as-is
+_DIRECT_COMMAND_PREFIXES = (
+    "ls",
+    "pwd",
+    "cat",
+    "grep",
+    "find",
+    "python",
+    "node",
+    "npm",
+    "pip",
+)
+
+# Requests for command suggestions
+_SUGGESTION_RE = _compile_any(["how to", "necə", "suggest", "təklif et"])
+
+# Signs that short input is a question rather than a command
+_QUESTION_HINT_RE = _compile_any(["?", "what", "how", "nə", "necə"])
+
+# Descriptions shown next to suggested commands, by command name
+_COMMAND_DESCRIPTIONS = {
+    "ls": "List files and directories",
+    "pwd": "Show current directory",
+    "cd": "Change directory",
+    "cat": "Display file contents",
+    "grep": "Search text in files",
+    "find": "Search for files",
+    "python": "Run Python script",
+    "pip": "Install Python packages",
+    "npm": "Node.js package manager",
+    "curl": "Download from URL",
+    "wget": "Download files",
+    "df": "Show disk usage",
+    "ps": "Show running processes",
+}
 
 
 class TerminalHandler(BaseHandler):
@@ -41,56 +117,22 @@ class TerminalHandler(BaseHandler):
 
     async def handle(self, user_input: str) -> bool:
         """Handle terminal command execution requests."""
-        lower_input = user_input.lower()
+        lower_input = self.normalize_input(user_input)
 
         # Skip AI-like questions (contain these patterns)
-        ai_question_patterns = [
-            "what is",
-            "what are",
-            "explain",
-            "difference between",
-            "how to",
-            "why",
-            "when",
-            "where",
-            "necə",
-            "niyə",
-            "nə vaxt",
-        ]
-
-        if any(pattern in lower_input for pattern in ai_question_patterns):
+        if _AI_QUESTION_RE.search(lower_input):
             return False
 
-        # Check if it looks like a direct shell command (starts with common commands)
-        starts_with_command = any(
-            lower_input.startswith(cmd + " ") or lower_input == cmd
-            for cmd in [
-                "ls",
-                "pwd",
-                "cd",
-                "cat",
-                "grep",
-                "find",
-                "python3",
-                "node",
-                "npm",
-                "pip",
-            ]
-        )
-
         # Only handle if it's clearly a terminal command
-        if starts_with_command:
+        if _SHELL_COMMAND_START_RE.match(lower_input):
             self.log_debug(f"Processing terminal command: {user_input}")
             await self._process_terminal_command(user_input)
             return True
 
         # Check for explicit run/execute keywords with commands
-        if any(word in lower_input for word in ["run", "execute", "işlet", "çalıştır"]):
+        if _RUN_VERB_RE.search(lower_input):
             # Only if it contains actual command words
-            has_command = any(
-                cmd in lower_input
-                for cmd in ["ls", "pwd", "python", "node", "npm", "git"]
-            )
+            has_command = _COMMAND_MENTION_RE.search(lower_input) is not None
             if has_command:
                 self.log_debug(f"Processing requested command: {user_input}")
                 await self._process_terminal_command(user_input)
@@ -109,23 +151,13 @@ class TerminalHandler(BaseHandler):
             return
 
         # Handle direct commands (already look like shell commands)
-        direct_commands = [
-            "ls",
-            "pwd",
-            "cat",
-            "grep",
-            "find",
-            "python",
-            "node",
-            "npm",
-            "pip",
-        ]
-        if any(command.strip().startswith(cmd) for cmd in direct_commands):
-            await self.smart_cli.terminal_manager.execute_command(command.strip())
+        stripped = command.strip()
+        if stripped.startswith(_DIRECT_COMMAND_PREFIXES):
+            await self.smart_cli.terminal_manager.execute_command(stripped)
             return
 
         # Handle natural language requests
-        if any(word in lower_cmd for word in ["run", "execute", "işlet", "çalıştır"]):
+        if _RUN_VERB_RE.search(lower_cmd):
             # Extract the actual command
             actual_command = self._extract_command_from_natural_language(
                 command, lower_cmd
@@ -142,9 +174,7 @@ class TerminalHandler(BaseHandler):
             return
 
         # Handle command suggestions
-        if any(
-            word in lower_cmd for word in ["how to", "necə", "suggest", "təklif et"]
-        ):
+        if _SUGGESTION_RE.search(lower_cmd):
             suggestions = (
                 await self.smart_cli.terminal_manager.smart_command_suggestion(
                     command, self.ai_client
@@ -155,10 +185,8 @@ class TerminalHandler(BaseHandler):
             return
 
         # Default: try to execute as-is if it looks like a command
-        if len(command.split()) <= 5 and not any(
-            char in command for char in ["?", "what", "how", "nə", "necə"]
-        ):
-            await self.smart_cli.terminal_manager.execute_command(command.strip())
+        if len(command.split()) <= 5 and not _QUESTION_HINT_RE.search(command):
+            await self.smart_cli.terminal_manager.execute_command(stripped)
         else:
             # Use AI assistance for complex requests
             await self.smart_cli.terminal_manager.execute_with_ai_assistance(
@@ -169,11 +197,10 @@ class TerminalHandler(BaseHandler):
         self, command: str, lower_cmd: str
     ) -> str:
         """Extract actual command from natural language request."""
-        for prefix in ["run ", "execute ", "işlet ", "çalıştır "]:
-            if prefix in lower_cmd:
-                actual_command = command[
-                    command.lower().find(prefix) + len(prefix) :
-                ].strip()
+        for prefix in _RUN_PREFIXES:
+            index = lower_cmd.find(prefix)
+            if index != -1:
+                actual_command = command[index + len(prefix) :].strip()
                 if actual_command:
                     return actual_command
         return ""
@@ -200,21 +227,6 @@ class TerminalHandler(BaseHandler):
 
     def _get_command_description(self, cmd: str) -> str:
         """Get simple description for command."""
-        descriptions = {
-            "ls": "List files and directories",
-            "pwd": "Show current directory",
-            "cd": "Change directory",
-            "cat": "Display file contents",
-            "grep": "Search text in files",
-            "find": "Search for files",
-            "python": "Run Python script",
-            "pip": "Install Python packages",
-            "npm": "Node.js package manager",
-            "curl": "Download from URL",
-            "wget": "Download files",
-            "df": "Show disk usage",
-            "ps": "Show running processes",
-        }
-
-        first_word = cmd.split()[0] if cmd.split() else cmd
-        return descriptions.get(first_word, "Execute command")
+        words = cmd.split(None, 1)
+        first_word = words[0] if words else cmd
+        return _COMMAND_DESCRIPTIONS.get(first_word, "Execute command")
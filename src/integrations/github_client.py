@@ -1,11 +1,13 @@
 """Smart CLI GitHub Integration - Advanced repository management."""
 
 import asyncio
+import copy
 import json
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 from rich.console import Console
@@ -15,6 +17,9 @@ from rich.table import Table
 
 console = Console()
 
+# GET responses remembered for conditional requests
+ETAG_CACHE_SIZE = 256
+
 
 @dataclass
 class GitHubRepo:
@@ -73,6 +78,8 @@ class GitHubClient:
         self.session = None
         self.rate_limit_remaining = 5000
         self.rate_limit_reset = 0
+        # ETag and parsed body of recent GET responses, by URL (LRU)
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
 
     async def initialize(self):
         """Initialize HTTP session."""
@@ -98,8 +105,14 @@ class GitHubClient:
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
+        # Revalidate cached GET responses; a 304 reuses the stored body
+        cached = self._etag_cache.get(url) if method == "GET" else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+
         try:
-            async with self.session.request(method, url, json=data) as response:
+            async with self.session.request(
+                method, url, json=data, headers=headers
+            ) as response:
                 # Update rate limit info
                 self.rate_limit_remaining = int(
                     response.headers.get("X-RateLimit-Remaining", 0)
@@ -108,8 +121,19 @@ class GitHubClient:
                     response.headers.get("X-RateLimit-Reset", 0)
                 )
 
-                if response.status == 200 or response.status == 201:
-                    return await response.json()
+                if response.status == 304 and cached:
+                    self._etag_cache.move_to_end(url)
+                    # Callers own what they get back; keep the cached body intact
+                    return copy.deepcopy(cached[1])
+                elif response.status == 200 or response.status == 201:
+                    result = await response.json()
+                    etag = response.headers.get("ETag")
+                    if method == "GET" and etag:
+                        self._etag_cache[url] = (etag, copy.deepcopy(result))
+                        self._etag_cache.move_to_end(url)
+                        if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                            self._etag_cache.popitem(last=False)
+                    return result
                 elif (
                     response.status == 403
                     and "rate limit" in (await response.text()).lower()
@@ -0,0 +1,146 @@
+"""Tests for shared handler behaviour in BaseHandler."""
+
+import re
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.handlers import base_handler
+from src.handlers.base_handler import BaseHandler
+
+
+class KeywordHandler(BaseHandler):
+    """Minimal concrete handler used for testing."""
+
+    @property
+    def keywords(self) -> list[str]:
+        return ["deploy", "yeni branch", "$"]
+
+    async def handle(self, user_input: str) -> bool:
+        return self.matches_input(user_input)
+
+
+class AzerbaijaniKeywordHandler(KeywordHandler):
+    """Handler with non-ASCII keywords used for testing."""
+
+    @property
+    def keywords(self) -> list[str]:
+        return ["büdcə", "icra"]
+
+
+class TestMatchesInput:
+    """Test keyword matching in BaseHandler."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.handler = KeywordHandler(Mock())
+
+    @pytest.mark.parametrize(
+        "user_input,expected",
+        [
+            ("Deploy the app", True),
+            ("redeployment", True),
+            ("Yeni Branch yarat", True),
+            ("echo $HOME", True),
+            ("hello world", False),
+            ("", False),
+        ],
+    )
+    def test_matches_input(self, user_input, expected):
+        """Test substring keyword matching is case-insensitive."""
+        assert self.handler.matches_input(user_input) is expected
+
+    def test_fallback_without_ahocorasick(self):
+        """Test the regex fallback gives the same results without pyahocorasick."""
+        with patch.object(base_handler, "ahocorasick", None):
+            handler = KeywordHandler(Mock())
+            assert handler.matches_input("please DEPLOY now")
+            assert not handler.matches_input("nothing here")
+            assert isinstance(handler._keyword_matcher, re.Pattern)
+
+    def test_matcher_shared_between_instances(self):
+        """Test handlers with the same keywords reuse one matcher."""
+        other = KeywordHandler(Mock())
+        self.handler.matches_input("deploy")
+        other.matches_input("deploy")
+        assert other._keyword_matcher is self.handler._keyword_matcher
+
+    def test_precomputed_lower_input_is_used(self):
+        """Test a caller-supplied lowercase input is matched as given."""
+        assert self.handler.matches_input("ignored", lower_input="deploy it")
+        assert not self.handler.matches_input("DEPLOY", lower_input="nothing")
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Deploy", "deploy"),
+            ("BU\u0308DCE\u0301", "büdcé"),
+            ("İCRA ET", "icra et"),
+            ("Yeni Branch", "yeni branch"),
+        ],
+    )
+    def test_normalize_input(self, text, expected):
+        """Test input is NFC-normalized and lowercased for matching."""
+        assert BaseHandler.normalize_input(text) == expected
+
+    def test_normalized_input_shared_across_handlers(self):
+        """Test handlers reuse one normalized string for the same input."""
+        text = "Please DEPLOY the büdcə report"
+        first = KeywordHandler(Mock()).normalize_input(text)
+        second = AzerbaijaniKeywordHandler(Mock()).normalize_input(text)
+        assert first is second
+
+    def test_decomposed_input_matches_precomposed_keyword(self):
+        """Test Azerbaijani keywords match regardless of Unicode form."""
+        handler = AzerbaijaniKeywordHandler(Mock())
+        assert handler.matches_input("bu\u0308dcə göstər")
+        assert handler.matches_input("İCRA ET")
+
+
+class TestExtractContentAfterKeyword:
+    """Test extracting text that follows a keyword."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.handler = KeywordHandler(Mock())
+
+    def test_returns_original_case_text_after_keyword(self):
+        """Test the remainder keeps its original case and is stripped."""
+        result = self.handler.extract_content_after_keyword(
+            "Please DEPLOY  My-App ", "deploy"
+        )
+        assert result == "My-App"
+
+    def test_missing_keyword_returns_empty(self):
+        """Test an absent keyword yields an empty string."""
+        assert self.handler.extract_content_after_keyword("hello", "deploy") == ""
+
+
+class TestSafeExecute:
+    """Test safe_execute with sync and async callables."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        smart_cli = Mock()
+        smart_cli.debug = False
+        self.handler = KeywordHandler(smart_cli)
+
+    @pytest.mark.asyncio
+    async def test_runs_sync_and_async_callables(self):
+        """Test both function kinds return their results."""
+
+        async def async_add(a, b):
+            return a + b
+
+        assert await self.handler.safe_execute(async_add, 1, 2) == 3
+        assert await self.handler.safe_execute(lambda a: a * 2, 4) == 8
+        assert await self.handler.safe_execute(self.handler.handle, "deploy") is True
+
+    @pytest.mark.asyncio
+    async def test_errors_return_none(self):
+        """Test exceptions are swallowed and None is returned."""
+
+        def fail():
+            raise ValueError("boom")
+
+        assert await self.handler.safe_execute(fail) is None
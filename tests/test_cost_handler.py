@@ -1,5 +1,6 @@
 """Tests for cost handler and budget management CLI commands."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock, mock_open
 import tempfile
@@ -153,6 +154,38 @@ class TestCostHandlerCommands:
         mock_optimizer.suggest_cost_optimization.assert_called_once()
         mock_console.print.assert_called()
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("command,expected", [
+        ("set budget, then show status", "_show_cost_status"),
+        ("cost preset list", "_handle_profile_commands"),
+        ("budget configure daily 5", "_set_budget_limits"),
+        ("cost budget", "_configure_budget"),
+        ("price suggestions", "_show_optimization_suggestions"),
+        ("cost models", "_show_model_pricing"),
+        ("cost", "_show_cost_help"),
+    ])
+    async def test_command_category_priority(self, command, expected):
+        """Test dispatch follows category priority, not keyword position."""
+        with patch.object(self.handler, expected) as mock_target, \
+             patch('src.handlers.cost_handler.get_cost_optimizer'):
+            await self.handler._process_cost_command(command)
+            
+            mock_target.assert_called_once()
+    
+    @pytest.mark.asyncio
+    @patch('src.handlers.cost_handler.get_cost_optimizer')
+    @patch('src.handlers.cost_handler.console')
+    async def test_cost_optimizer_looked_up_once(self, mock_console, mock_get_optimizer):
+        """Test the cost optimizer is resolved once per handler."""
+        mock_optimizer = Mock()
+        mock_optimizer.suggest_cost_optimization.return_value = []
+        mock_get_optimizer.return_value = mock_optimizer
+        
+        await self.handler._process_cost_command("cost optimize")
+        await self.handler._process_cost_command("cost suggest")
+        
+        mock_get_optimizer.assert_called_once()
+    
     @pytest.mark.asyncio
     @patch('src.handlers.cost_handler.console')
     async def test_show_cost_help(self, mock_console):
@@ -160,6 +193,18 @@ class TestCostHandlerCommands:
         await self.handler._show_cost_help()
         mock_console.print.assert_called()
 
+    @pytest.mark.asyncio
+    @patch('src.handlers.cost_handler.console')
+    async def test_help_is_printed_in_one_call(self, mock_console):
+        """Test help text is emitted with a single console call."""
+        await self.handler._show_cost_help()
+        await self.handler._show_profile_help()
+
+        assert mock_console.print.call_count == 2
+        args, kwargs = mock_console.print.call_args
+        assert kwargs == {"sep": "\n"}
+        assert args[0] == "📋 [bold blue]Budget Profile Commands:[/bold blue]"
+
 
 class TestBudgetLimitSetting:
     """Test budget limit setting functionality."""
@@ -230,6 +275,15 @@ class TestBudgetLimitSetting:
                         await self.handler._set_budget_limits(Mock(), command)
                         mock_update.assert_called()
     
+    @pytest.mark.asyncio
+    async def test_set_budget_limits_dispatches_by_type(self):
+        """Test the parsed amount reaches the matching limit updater."""
+        with patch.object(self.handler, '_update_monthly_limit') as mock_update:
+            await self.handler._set_budget_limits(Mock(), "Cost Set MONTHLY 250.75")
+
+            mock_update.assert_called_once()
+            assert mock_update.call_args[0][1] == 250.75
+    
     @pytest.mark.asyncio
     @patch('src.handlers.cost_handler.console')
     async def test_parse_budget_command_invalid_amount(self, mock_console):
@@ -305,6 +359,63 @@ class TestEnvFileUpdates:
             assert warning_call
 
 
+class TestProjectConfigUpdates:
+    """Test .smart/budget.json updates."""
+    
+    def setup_method(self):
+        """Setup test environment."""
+        self.mock_smart_cli = Mock()
+        self.handler = CostHandler(self.mock_smart_cli)
+    
+    @pytest.mark.asyncio
+    @patch('src.handlers.cost_handler.console')
+    async def test_update_project_config_writes_setting(self, mock_console, tmp_path, monkeypatch):
+        """Test a new setting is written without leaving a temporary file."""
+        monkeypatch.chdir(tmp_path)
+        
+        await self.handler._update_project_config("AI_DAILY_LIMIT", "10.0")
+        
+        config = json.loads((tmp_path / ".smart" / "budget.json").read_text())
+        assert config["AI_DAILY_LIMIT"] == "10.0"
+        assert "updated_at" in config
+        assert not (tmp_path / ".smart" / "budget.json.tmp").exists()
+    
+    @pytest.mark.asyncio
+    @patch('src.handlers.cost_handler.console')
+    async def test_update_project_config_skips_unchanged_value(self, mock_console, tmp_path, monkeypatch):
+        """Test re-applying the same value leaves the file untouched."""
+        monkeypatch.chdir(tmp_path)
+        await self.handler._update_project_config("AI_DAILY_LIMIT", "10.0")
+        config_file = tmp_path / ".smart" / "budget.json"
+        before = config_file.read_text()
+        mock_console.reset_mock()
+        
+        await self.handler._update_project_config("AI_DAILY_LIMIT", "10.0")
+        
+        assert config_file.read_text() == before
+        mock_console.print.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('src.handlers.cost_handler.console')
+    async def test_update_project_config_many_writes_once(self, mock_console, tmp_path, monkeypatch):
+        """Test a batch of settings is written with a single summary line."""
+        monkeypatch.chdir(tmp_path)
+        await self.handler._update_project_config("AI_DAILY_LIMIT", "5.0")
+        mock_console.reset_mock()
+        
+        with patch('src.handlers.cost_handler.os.replace', wraps=os.replace) as mock_replace:
+            await self.handler._update_project_config_many(
+                {"AI_DAILY_LIMIT": "5.0", "AI_MONTHLY_LIMIT": "100.0", "AI_REQUEST_LIMIT": "0.5"}
+            )
+        
+        mock_replace.assert_called_once()
+        config = json.loads((tmp_path / ".smart" / "budget.json").read_text())
+        assert config["AI_MONTHLY_LIMIT"] == "100.0"
+        assert config["AI_REQUEST_LIMIT"] == "0.5"
+        mock_console.print.assert_called_once()
+        assert "Updated 2 settings" in str(mock_console.print.call_args)
+
+
 class TestBudgetProfileCommands:
     """Test budget profile management commands."""
     
@@ -394,11 +505,36 @@ class TestBudgetProfileCommands:
         error_call = any("specify a profile name" in str(call) for call in mock_console.print.call_args_list)
         assert error_call
     
+    @pytest.mark.asyncio
+    @patch('src.handlers.cost_handler.console')
+    async def test_apply_profile_without_session_manager(self, mock_console):
+        """Test applying a profile works when no session manager is set."""
+        self.handler.session_manager = None
+        
+        mock_manager = Mock()
+        mock_profile = Mock()
+        mock_profile.name = "Developer"
+        mock_profile.daily_limit = 5.0
+        mock_profile.monthly_limit = 100.0
+        mock_profile.per_request_limit = 0.5
+        mock_manager.get_profile_by_name.return_value = mock_profile
+        mock_manager.list_profiles.return_value = {
+            UsageProfile.DEVELOPER: mock_profile
+        }
+        mock_manager.apply_profile.return_value = {}
+        
+        with patch.object(self.handler, '_update_project_config_many') as mock_update:
+            await self.handler._apply_budget_profile(mock_manager, "cost profile set developer")
+            
+            mock_manager.apply_profile.assert_called_once_with(UsageProfile.DEVELOPER)
+            mock_update.assert_called_once_with({})
+    
     @pytest.mark.asyncio
     async def test_apply_profile_with_session_manager(self):
         """Test applying profile updates session manager."""
         mock_session_manager = Mock()
         self.mock_smart_cli.session_manager = mock_session_manager
+        self.handler.session_manager = mock_session_manager
         
         mock_manager = Mock()
         mock_profile = Mock()
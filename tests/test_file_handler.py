@@ -0,0 +1,59 @@
+"""Tests for the file operations handler."""
+
+import os
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.handlers.file_handler import ANALYSIS_PREFIX_CHARS, FileHandler
+
+
+class TestAnalyzeTechnicalDocument:
+    """Test technical document analysis."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.smart_cli = Mock()
+        self.smart_cli.ai_client.generate_response = AsyncMock(
+            return_value=Mock(content="plan")
+        )
+        self.handler = FileHandler(self.smart_cli)
+        self.handler.ui_manager = Mock()
+
+    @pytest.mark.asyncio
+    @patch("src.handlers.file_handler.console")
+    async def test_prompt_uses_bounded_prefix(self, mock_console, tmp_path):
+        """Test only the prompt prefix is read while the full size is reported."""
+        document = tmp_path / "spec.md"
+        document.write_text("ə" * (ANALYSIS_PREFIX_CHARS * 2), encoding="utf-8")
+
+        await self.handler._analyze_technical_document(str(document))
+
+        prompt = self.smart_cli.ai_client.generate_response.call_args[0][0]
+        assert "ə" * ANALYSIS_PREFIX_CHARS + "..." in prompt
+        assert "ə" * (ANALYSIS_PREFIX_CHARS + 1) not in prompt
+        self.handler.ui_manager.update_task.assert_called_once_with(
+            self.handler.ui_manager.start_task.return_value,
+            "in_progress",
+            f"Oxundu: {document.stat().st_size} bayt",
+        )
+
+    @pytest.mark.asyncio
+    @patch("src.handlers.file_handler.console")
+    async def test_unchanged_document_reuses_analysis(self, mock_console, tmp_path):
+        """Test the AI is only asked again after the document changes."""
+        document = tmp_path / "spec.md"
+        document.write_text("# Spec", encoding="utf-8")
+
+        await self.handler._analyze_technical_document(str(document))
+        await self.handler._analyze_technical_document(str(document))
+
+        assert self.smart_cli.ai_client.generate_response.await_count == 1
+        self.smart_cli.todo_manager.add_analysis_todos.assert_called_once()
+        assert self.handler.ui_manager.display_ai_response.call_count == 2
+
+        document.write_text("# Spec v2", encoding="utf-8")
+        os.utime(document, ns=(0, 0))
+        await self.handler._analyze_technical_document(str(document))
+
+        assert self.smart_cli.ai_client.generate_response.await_count == 2
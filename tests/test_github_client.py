@@ -0,0 +1,98 @@
+"""Tests for the GitHub API client."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.integrations.github_client import GitHubClient
+
+
+class FakeResponse:
+    """Minimal aiohttp response used as an async context manager."""
+
+    def __init__(self, status, body=None, etag=None):
+        self.status = status
+        self.headers = {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "0"}
+        if etag:
+            self.headers["ETag"] = etag
+        self.json = AsyncMock(return_value=body)
+        self.text = AsyncMock(return_value="")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation of GET requests."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.client = GitHubClient(token="test-token")
+        self.client.session = Mock()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_body(self):
+        """Test a 304 answer returns the body stored with the ETag."""
+        repos = [{"name": "smart-cli"}]
+        not_modified = FakeResponse(304)
+        self.client.session.request.side_effect = [
+            FakeResponse(200, repos, etag='"abc"'),
+            not_modified,
+        ]
+
+        first = await self.client._make_request("GET", "user/repos")
+        second = await self.client._make_request("GET", "user/repos")
+
+        assert first == second == repos
+        not_modified.json.assert_not_awaited()
+        calls = self.client.session.request.call_args_list
+        assert calls[0].kwargs["headers"] is None
+        assert calls[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+    @pytest.mark.asyncio
+    async def test_mutating_results_does_not_change_cache(self):
+        """Test callers can modify returned bodies without affecting later calls."""
+        self.client.session.request.side_effect = [
+            FakeResponse(200, [{"name": "smart-cli"}], etag='"abc"'),
+            FakeResponse(304),
+            FakeResponse(304),
+        ]
+
+        first = await self.client._make_request("GET", "user/repos")
+        first.append({"name": "added"})
+        second = await self.client._make_request("GET", "user/repos")
+        second[0]["name"] = "changed"
+        third = await self.client._make_request("GET", "user/repos")
+
+        assert third == [{"name": "smart-cli"}]
+
+    @pytest.mark.asyncio
+    async def test_post_requests_are_not_cached(self):
+        """Test only GET responses are revalidated."""
+        self.client.session.request.side_effect = lambda *a, **kw: FakeResponse(
+            201, {"number": 1}, etag='"abc"'
+        )
+
+        await self.client._make_request("POST", "repos/o/r/pulls", {"title": "x"})
+        await self.client._make_request("POST", "repos/o/r/pulls", {"title": "x"})
+
+        calls = self.client.session.request.call_args_list
+        assert [c.kwargs["headers"] for c in calls] == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """Test the ETag cache stays within its size limit."""
+        self.client.session.request.side_effect = lambda method, url, **kw: (
+            FakeResponse(200, {"url": url}, etag=url)
+        )
+
+        with patch("src.integrations.github_client.ETAG_CACHE_SIZE", 2):
+            for endpoint in ("a", "b", "a", "c"):
+                await self.client._make_request("GET", endpoint)
+
+        assert list(self.client._etag_cache) == [
+            "https://api.github.com/a",
+            "https://api.github.com/c",
+        ]
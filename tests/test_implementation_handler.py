@@ -0,0 +1,121 @@
+"""Tests for the implementation handler."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.handlers.implementation_handler import DOC_PREFIX_CHARS, ImplementationHandler
+
+
+class TestCreateFilesFromResponse:
+    """Test extracting files from AI responses."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.handler = ImplementationHandler(Mock())
+        self.handler.ui_manager = Mock()
+
+    @pytest.mark.asyncio
+    @patch("src.handlers.implementation_handler.console")
+    async def test_filename_blocks_are_written(
+        self, mock_console, tmp_path, monkeypatch
+    ):
+        """Test FILENAME/CODE blocks become files with their code."""
+        monkeypatch.chdir(tmp_path)
+        response = (
+            "FILENAME: app.py\nCODE:\n```python\nprint('app')\n```\n"
+            "filename: notes.md\ncode:\n```markdown\n# Notes\n```\n"
+        )
+
+        await self.handler._create_files_from_response(response)
+
+        assert (tmp_path / "app.py").read_text() == "print('app')"
+        assert (tmp_path / "notes.md").read_text() == "# Notes"
+
+    @pytest.mark.asyncio
+    @patch("src.handlers.implementation_handler.console")
+    async def test_unnamed_code_blocks_fall_back_to_generic_files(
+        self, mock_console, tmp_path, monkeypatch
+    ):
+        """Test substantial unnamed code blocks get generated file names."""
+        monkeypatch.chdir(tmp_path)
+        code = "def main():\n    return 'generated implementation body'\n"
+
+        await self.handler._create_files_from_response(f"```python\n{code}```")
+
+        assert (tmp_path / "generated_file_1.py").read_text() == code.strip()
+
+    @pytest.mark.asyncio
+    @patch("src.handlers.implementation_handler.console")
+    async def test_summary_counts_lines_of_written_code(
+        self, mock_console, tmp_path, monkeypatch
+    ):
+        """Test the contents summary reports each file's line count."""
+        monkeypatch.chdir(tmp_path)
+        response = "FILENAME: app.py\nCODE:\n```python\na = 1\nb = 2\nc = 3\n```\n"
+
+        await self.handler._create_files_from_response(response)
+
+        printed = [c.args[0] for c in mock_console.print.call_args_list if c.args]
+        assert "   • app.py: 3 lines" in printed
+
+    @pytest.mark.asyncio
+    @patch("src.handlers.implementation_handler.console")
+    async def test_repeated_filename_keeps_last_block(
+        self, mock_console, tmp_path, monkeypatch
+    ):
+        """Test a file named twice is written once with its last code block."""
+        monkeypatch.chdir(tmp_path)
+        response = (
+            "FILENAME: app.py\nCODE:\n```python\nv = 1\n```\n"
+            "FILENAME: app.py\nCODE:\n```python\nv = 2\n```\n"
+        )
+
+        await self.handler._create_files_from_response(response)
+
+        assert (tmp_path / "app.py").read_text() == "v = 2"
+        printed = [c.args[0] for c in mock_console.print.call_args_list if c.args]
+        assert printed.count("✅ [green]Created: app.py[/green]") == 1
+
+    @pytest.mark.asyncio
+    @patch("src.handlers.implementation_handler.console")
+    async def test_failed_write_does_not_stop_other_files(
+        self, mock_console, tmp_path, monkeypatch
+    ):
+        """Test one unwritable file is reported while the others are created."""
+        monkeypatch.chdir(tmp_path)
+        response = (
+            "FILENAME: missing/app.py\nCODE:\n```python\nv = 1\n```\n"
+            "FILENAME: ok.py\nCODE:\n```python\nv = 2\n```\n"
+        )
+
+        await self.handler._create_files_from_response(response)
+
+        assert (tmp_path / "ok.py").read_text() == "v = 2"
+        printed = [c.args[0] for c in mock_console.print.call_args_list if c.args]
+        assert any(
+            p.startswith("❌ [red]Failed to create missing/app.py") for p in printed
+        )
+
+
+class TestReadProjectDocumentation:
+    """Test collecting markdown documentation for the prompt."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.handler = ImplementationHandler(Mock())
+
+    @pytest.mark.asyncio
+    async def test_reads_prefix_of_each_markdown_file(self, tmp_path, monkeypatch):
+        """Test every markdown file contributes at most the prompt prefix."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "README.md").write_text("r" * (DOC_PREFIX_CHARS + 500))
+        (tmp_path / "DESIGN.md").write_text("design notes")
+        (tmp_path / "main.py").write_text("print()")
+        (tmp_path / "docs.md").mkdir()
+
+        docs = await self.handler._read_project_documentation()
+
+        assert sorted(docs) == [
+            "=== DESIGN.md ===\\ndesign notes...",
+            f"=== README.md ===\\n{'r' * DOC_PREFIX_CHARS}...",
+        ]
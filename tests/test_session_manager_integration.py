@@ -172,6 +172,56 @@ class TestSessionManagerBudgetEdgeCases:
         history = self.session_manager.get_recent_history(1)
         assert len(history) == 1
         assert history[0]["content"] == "test message"
+        assert datetime.fromisoformat(history[0]["timestamp"])
+
+    def test_history_is_bounded_and_ordered(self):
+        """Test history keeps only the newest entries in insertion order."""
+        from src.core.session_manager import MAX_HISTORY_ENTRIES
+
+        for i in range(MAX_HISTORY_ENTRIES + 5):
+            self.session_manager.add_to_history("user", f"message {i}")
+
+        assert len(self.session_manager.history_store) == MAX_HISTORY_ENTRIES
+        recent = self.session_manager.get_recent_history(2)
+        assert [entry["content"] for entry in recent] == [
+            f"message {MAX_HISTORY_ENTRIES + 3}",
+            f"message {MAX_HISTORY_ENTRIES + 4}",
+        ]
+
+
+class TestHistoryStoreBackends:
+    """Test conversation history storage backends."""
+
+    def test_sqlite_store_tail_and_trim(self, tmp_path):
+        """Test SQLite backend returns newest entries and trims old rows."""
+        from src.core.history_store import SQLiteHistoryStore
+
+        store = SQLiteHistoryStore("session", str(tmp_path / "history.db"), max_entries=3)
+        for i in range(5):
+            store.append({"role": "user", "content": str(i), "ts": i})
+
+        assert len(store) == 3
+        assert [entry["content"] for entry in store.tail(2)] == ["3", "4"]
+
+    def test_base_store_is_abstract(self):
+        """Test backends must implement the whole store interface."""
+        from src.core.history_store import HistoryStore
+
+        with pytest.raises(TypeError):
+            HistoryStore()
+
+    def test_unavailable_backend_falls_back_to_memory(self, monkeypatch, caplog):
+        """Test that a failing backend logs a warning and falls back to memory."""
+        from src.core import history_store
+
+        monkeypatch.setenv("SMART_HISTORY_BACKEND", "redis")
+        monkeypatch.setattr(history_store, "redis", None)
+
+        with caplog.at_level("WARNING", logger=history_store.__name__):
+            store = history_store.create_history_store("session")
+        assert isinstance(store, history_store.InMemoryHistoryStore)
+        assert "redis history backend" in caplog.text
+        assert "redis package is not installed" in caplog.text
 
 
 class TestSessionManagerBudgetProfileIntegration:
@@ -211,7 +261,24 @@ class TestSessionManagerBudgetProfileIntegration:
         
         # Console should have been called for both switches
         assert mock_console.print.call_count >= 2
-    
+
+    @patch('src.core.session_manager.console')
+    def test_profile_lookup_cached_until_profile_changes(self, mock_console):
+        """Test that the resolved profile is reused until the profile changes."""
+        self.session_manager.set_budget_profile(UsageProfile.DEVELOPER)
+
+        with patch.object(
+            self.session_manager.budget_manager, 'get_profile',
+            wraps=self.session_manager.budget_manager.get_profile,
+        ) as mock_get_profile:
+            self.session_manager.display_welcome()
+            self.session_manager.show_budget_info()
+            mock_get_profile.assert_not_called()
+
+            self.session_manager.set_budget_profile(UsageProfile.STARTUP)
+            self.session_manager.show_budget_info()
+            mock_get_profile.assert_called_once_with(UsageProfile.STARTUP)
+
     def test_budget_profile_persistence_during_session(self):
         """Test that budget profile persists during session operations."""
         self.session_manager.set_budget_profile(UsageProfile.STARTUP)
@@ -0,0 +1,85 @@
+"""Tests for the simple Git manager."""
+
+import shutil
+import subprocess
+
+import pytest
+from unittest.mock import Mock
+
+from src.core.simple_git import SimpleGitManager, _parse_branch_header
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+class TestCheckGitStatus:
+    """Test git status parsing."""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            (b"main", "main"),
+            (b"main...origin/main [ahead 1, behind 2]", "main"),
+            (b"feature/x...origin/feature/x", "feature/x"),
+            (b"No commits yet on trunk", "trunk"),
+            (b"Initial commit on trunk", "trunk"),
+            (b"HEAD (no branch)", ""),
+        ],
+    )
+    def test_parse_branch_header(self, header, expected):
+        """Test branch names are read from status headers."""
+        assert _parse_branch_header(header) == expected
+
+    @pytest.mark.asyncio
+    async def test_status_reports_branch_and_files(self, tmp_path, monkeypatch):
+        """Test one status call reports the branch and file states."""
+        _git(tmp_path, "init", "-q", "-b", "trunk")
+        (tmp_path / "tracked.txt").write_text("a")
+        _git(tmp_path, "add", "tracked.txt")
+        _git(tmp_path, "commit", "-q", "-m", "init")
+        (tmp_path / "tracked.txt").write_text("b")
+        (tmp_path / "staged.txt").write_text("c")
+        _git(tmp_path, "add", "staged.txt")
+        (tmp_path / "new.txt").write_text("d")
+        monkeypatch.chdir(tmp_path)
+
+        status = await SimpleGitManager().check_git_status()
+
+        assert status == {
+            "branch": "trunk",
+            "modified": ["tracked.txt", "new.txt"],
+            "staged": ["staged.txt"],
+            "untracked": ["new.txt"],
+        }
+
+
+class TestPushPull:
+    """Test push and pull failure reporting."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,title",
+        [("push_changes", "Push failed"), ("pull_changes", "Pull failed")],
+    )
+    async def test_failure_points_to_git_output(
+        self, method, title, tmp_path, monkeypatch
+    ):
+        """Test failures refer to git's own output instead of an empty detail."""
+        _git(tmp_path, "init", "-q", "-b", "trunk")
+        monkeypatch.chdir(tmp_path)
+        manager = SimpleGitManager()
+        manager.ui_manager = Mock()
+
+        assert await getattr(manager, method)() is False
+
+        manager.ui_manager.display_error.assert_called_once_with(
+            title, "See git output above"
+        )
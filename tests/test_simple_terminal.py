@@ -0,0 +1,126 @@
+"""Tests for the simple terminal manager."""
+
+import os
+import sys
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core.simple_terminal import MAX_CAPTURED_OUTPUT, SimpleTerminalManager
+
+
+def python_command(code: str) -> str:
+    """Build a shell command running ``code`` with the test interpreter."""
+    return f'"{sys.executable}" -c "{code}"'
+
+
+class TestExecuteCommandOutput:
+    """Test capturing command output."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.manager = SimpleTerminalManager()
+
+    @pytest.mark.asyncio
+    async def test_line_longer_than_cap_keeps_tail(self):
+        """Test a single line over the cap succeeds and keeps its last part."""
+        size = MAX_CAPTURED_OUTPUT * 2
+        code = f"import sys; sys.stdout.write('a' * {size} + 'end' + chr(10))"
+
+        result = await self.manager.execute_command(python_command(code))
+
+        assert result.success
+        assert len(result.output) == MAX_CAPTURED_OUTPUT
+        assert result.output.endswith("aend\n")
+
+    @pytest.mark.asyncio
+    async def test_output_without_newline_is_captured(self):
+        """Test output that never ends a line is still returned in full."""
+        code = "import sys; sys.stdout.write('x' * 200000)"
+
+        result = await self.manager.execute_command(python_command(code))
+
+        assert result.success
+        assert result.output == "x" * 200000
+
+    @pytest.mark.asyncio
+    async def test_multibyte_text_split_across_reads(self):
+        """Test UTF-8 characters are decoded intact across read boundaries."""
+        code = "import sys; sys.stdout.buffer.write(('ə' * 100000).encode())"
+
+        result = await self.manager.execute_command(python_command(code))
+
+        assert result.output == "ə" * 100000
+
+    @pytest.mark.asyncio
+    async def test_failed_read_kills_process(self):
+        """Test the child process is killed when reading its output fails."""
+        spawned = []
+        spawn = self.manager._spawn
+
+        async def record_spawn(command):
+            process = await spawn(command)
+            spawned.append(process)
+            return process
+
+        read_failure = RuntimeError("read failed")
+        with patch.object(self.manager, "_spawn", record_spawn):
+            with patch.object(self.manager, "_read_stream", side_effect=read_failure):
+                result = await self.manager.execute_command(
+                    python_command("import time; time.sleep(30)")
+                )
+
+        assert not result.success
+        assert result.error == "read failed"
+        assert spawned[0].returncode is not None
+
+
+class TestChangeDirectory:
+    """Test changing the working directory."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.manager = SimpleTerminalManager()
+        self.manager.ui_manager = Mock()
+
+    def test_symlinked_directory_keeps_logical_path(self, tmp_path, monkeypatch):
+        """Test the path as given is kept instead of the resolved symlink target."""
+        target = tmp_path / "target"
+        target.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(target, target_is_directory=True)
+        monkeypatch.chdir(tmp_path)
+
+        assert self.manager.change_directory("link") is True
+
+        assert self.manager.current_directory == str(link)
+        assert os.path.samefile(os.getcwd(), target)
+        self.manager.ui_manager.console.print.assert_called_once_with(
+            f"📁 [green]Changed to:[/green] {link}"
+        )
+
+    def test_missing_directory_is_reported(self, tmp_path, monkeypatch):
+        """Test a missing path leaves the directory unchanged."""
+        monkeypatch.chdir(tmp_path)
+        before = self.manager.current_directory
+
+        assert self.manager.change_directory("missing") is False
+
+        assert self.manager.current_directory == before
+        assert os.path.samefile(os.getcwd(), tmp_path)
+        self.manager.ui_manager.display_error.assert_called_once_with(
+            "Directory not found: missing"
+        )
+
+    def test_file_is_not_a_directory(self, tmp_path, monkeypatch):
+        """Test a regular file is rejected like a missing directory."""
+        (tmp_path / "notes.txt").write_text("x")
+        monkeypatch.chdir(tmp_path)
+        before = self.manager.current_directory
+
+        assert self.manager.change_directory("notes.txt") is False
+
+        assert self.manager.current_directory == before
+        self.manager.ui_manager.display_error.assert_called_once_with(
+            "Directory not found: notes.txt"
+        )
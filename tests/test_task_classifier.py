@@ -0,0 +1,218 @@
+"""Tests for smart task classification."""
+
+import pytest
+from unittest.mock import patch
+
+from src.core import task_classifier
+from src.core.task_classifier import TaskClassifier, TaskComplexity, TaskRisk
+
+
+class TestRiskClassification:
+    """Test risk classification precedence."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.classifier = TaskClassifier()
+
+    @pytest.mark.parametrize(
+        "request_text,expected",
+        [
+            ("quick fix for the login page", TaskRisk.LOW),
+            ("add jwt authentication", TaskRisk.CRITICAL),
+            ("refactor the parser", TaskRisk.HIGH),
+            ("implement a new feature", TaskRisk.MEDIUM),
+            ("update the readme docs", TaskRisk.MEDIUM),
+            ("rename the css class", TaskRisk.LOW),
+            ("hello there", TaskRisk.MEDIUM),
+        ],
+    )
+    def test_classify_risk(self, request_text, expected):
+        """Test risk levels for representative requests."""
+        _, risk = self.classifier.classify_task(request_text)
+        assert risk == expected
+
+    def test_high_risk_file_context(self):
+        """Test that high-risk files raise the risk level."""
+        _, risk = self.classifier.classify_task(
+            "change a value", {"file_paths": ["config/app.env"]}
+        )
+        assert risk == TaskRisk.CRITICAL
+
+    def test_overlapping_patterns_across_categories(self):
+        """Test that a low-risk match does not hide an overlapping critical one."""
+        _, risk = self.classifier.classify_task("textoken")
+        assert risk == TaskRisk.CRITICAL
+
+    def test_regex_fallback_matches_automaton(self):
+        """Test the regex matcher gives the same results without pyahocorasick."""
+        with patch.object(task_classifier, "ahocorasick", None):
+            fallback = TaskClassifier()
+
+        for request_text in ["add jwt authentication", "minor fix to docs", "textoken"]:
+            assert fallback.classify_task(
+                request_text
+            ) == self.classifier.classify_task(request_text)
+
+    def test_pattern_matcher_shared_between_instances(self):
+        """Test classifiers with the same patterns reuse one matcher."""
+        assert TaskClassifier()._pattern_matcher is self.classifier._pattern_matcher
+
+
+class TestClassificationCache:
+    """Test memoization of classify_task."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.classifier = TaskClassifier()
+
+    def test_repeat_classification_hits_cache(self):
+        """Test identical request and context are classified once."""
+        context = {"file_paths": ["a.py", "b.py"], "file_count": 2}
+        first = self.classifier.classify_task("Implement Feature", context)
+        second = self.classifier.classify_task("implement feature", dict(context))
+
+        assert first == second
+        assert self.classifier._classify_cached.cache_info().hits == 1
+
+    def test_unhashable_context_is_not_cached(self):
+        """Test contexts with unhashable values still classify correctly."""
+        context = {"file_paths": ["schema.sql"], "extra": {"nested": True}}
+        _, risk = self.classifier.classify_task("change a value", context)
+
+        assert risk == TaskRisk.CRITICAL
+        assert self.classifier._classify_cached.cache_info().currsize == 0
+
+    def test_pattern_scan_reuse_is_per_request(self):
+        """Test the last scan is reused only for the same request."""
+        first = self.classifier._scan_patterns("drop the database")
+        assert self.classifier._scan_patterns("drop the database") is first
+
+        other = self.classifier._scan_patterns("rename a variable")
+        assert other is not first
+        assert other != first
+        assert self.classifier._scan_patterns("drop the database") == first
+
+
+class TestComplexityClassification:
+    """Test complexity classification."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.classifier = TaskClassifier()
+
+    def test_critical_risk_is_critical_complexity(self):
+        """Test critical risk always maps to critical complexity."""
+        complexity, _ = self.classifier.classify_task("migrate the database")
+        assert complexity == TaskComplexity.CRITICAL
+
+    def test_large_file_count_is_complex(self):
+        """Test many files produce complex classification."""
+        complexity, _ = self.classifier.classify_task(
+            "implement feature", {"file_count": 20}
+        )
+        assert complexity == TaskComplexity.COMPLEX
+
+    def test_small_low_risk_change_is_micro(self):
+        """Test a small low-risk change is micro."""
+        complexity, _ = self.classifier.classify_task("fix typo in comment")
+        assert complexity == TaskComplexity.MICRO
+
+    @pytest.mark.parametrize(
+        "request_text,expected",
+        [
+            ("rewrite the whole project", 15),
+            ("work across multiple modules", 15),
+            ("add two classes", 5),
+            ("quick rename", 1),
+            ("make it rapid", 3),
+        ],
+    )
+    def test_estimate_file_count(self, request_text, expected):
+        """Test scope keywords match at word starts only."""
+        assert self.classifier._estimate_file_count(request_text) == expected
+
+
+class TestRecommendations:
+    """Test pipeline and model recommendations."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.classifier = TaskClassifier()
+
+    @pytest.mark.parametrize(
+        "complexity,risk,expected",
+        [
+            (TaskComplexity.MICRO, TaskRisk.LOW, ["modifier"]),
+            (
+                TaskComplexity.MEDIUM,
+                TaskRisk.MEDIUM,
+                ["architect", "modifier", "tester"],
+            ),
+            (
+                TaskComplexity.MEDIUM,
+                TaskRisk.HIGH,
+                ["analyzer", "architect", "modifier", "tester"],
+            ),
+            (
+                TaskComplexity.CRITICAL,
+                TaskRisk.CRITICAL,
+                ["analyzer", "architect", "modifier", "tester", "reviewer"],
+            ),
+        ],
+    )
+    def test_recommended_pipeline(self, complexity, risk, expected):
+        """Test pipelines for representative classifications."""
+        assert self.classifier.get_recommended_pipeline(complexity, risk) == expected
+
+    def test_recommendations_are_independent_copies(self):
+        """Test callers can modify results without affecting later calls."""
+        pipeline = self.classifier.get_recommended_pipeline(
+            TaskComplexity.MICRO, TaskRisk.LOW
+        )
+        models = self.classifier.get_recommended_models(
+            TaskComplexity.MICRO, TaskRisk.LOW
+        )
+        pipeline.append("reviewer")
+        models["modifier"] = "other"
+
+        assert self.classifier.get_recommended_pipeline(
+            TaskComplexity.MICRO, TaskRisk.LOW
+        ) == ["modifier"]
+        assert (
+            self.classifier.get_recommended_models(TaskComplexity.MICRO, TaskRisk.LOW)[
+                "modifier"
+            ]
+            == "llama-3-8b"
+        )
+
+
+class TestClassificationReport:
+    """Test classification reports."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.classifier = TaskClassifier()
+
+    def test_report_matches_classify_task(self):
+        """Test the report agrees with classify_task for mixed-case input."""
+        request_text = "Refactor the Project with a Quick JWT fix"
+        complexity, risk = self.classifier.classify_task(request_text)
+        report = self.classifier.create_classification_report(request_text)
+
+        assert report["complexity"] == complexity.value
+        assert report["risk"] == risk.value
+        assert report["estimated_file_count"] == 15
+        assert "Critical pattern: jwt" in report["reasoning"]["risk_factors"]
+        assert "Simple scope indicators" in report["reasoning"]["complexity_factors"]
+
+    def test_risk_factors_list_overlapping_patterns(self):
+        """Test factors include every pattern, with and without pyahocorasick."""
+        with patch.object(task_classifier, "ahocorasick", None):
+            fallback = TaskClassifier()
+
+        for classifier in (self.classifier, fallback):
+            report = classifier.create_classification_report("add authentication")
+            assert report["reasoning"]["risk_factors"] == [
+                "Critical pattern: auth",
+                "Critical pattern: authentication",
+            ]
@@ -0,0 +1,111 @@
+"""Tests for the terminal operations handler."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.handlers.terminal_handler import TerminalHandler
+
+
+class TestTerminalHandlerRouting:
+    """Test which inputs the terminal handler accepts."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        smart_cli = Mock()
+        smart_cli.debug = False
+        self.handler = TerminalHandler(smart_cli)
+        self.handler._process_terminal_command = AsyncMock()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "user_input,expected",
+        [
+            ("ls -la", True),
+            ("PWD", True),
+            ("pip", True),
+            ("lsof -i", False),
+            ("run python app.py", True),
+            ("İşlet npm test", True),
+            ("execute the plan", False),
+            ("what is ls", False),
+            ("cd\n", False),
+        ],
+    )
+    async def test_handle(self, user_input, expected):
+        """Test shell commands are accepted and questions are left to the AI."""
+        assert await self.handler.handle(user_input) is expected
+        assert self.handler._process_terminal_command.await_count == int(expected)
+
+
+class TestProcessTerminalCommand:
+    """Test how accepted terminal input is executed."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.smart_cli = Mock()
+        self.smart_cli.terminal_manager = AsyncMock()
+        self.handler = TerminalHandler(self.smart_cli)
+
+    @pytest.mark.asyncio
+    async def test_direct_command_runs_stripped(self):
+        """Test input starting with a shell command is executed as-is."""
+        await self.handler._process_terminal_command("  grep -r TODO src  ")
+
+        self.smart_cli.terminal_manager.execute_command.assert_awaited_once_with(
+            "grep -r TODO src"
+        )
+
+    @pytest.mark.asyncio
+    async def test_suggestion_request_asks_for_suggestions(self):
+        """Test suggestion phrases ask the terminal manager for suggestions."""
+        self.smart_cli.terminal_manager.smart_command_suggestion.return_value = []
+
+        await self.handler._process_terminal_command("how to list open ports")
+
+        self.smart_cli.terminal_manager.smart_command_suggestion.assert_awaited_once()
+        self.smart_cli.terminal_manager.execute_command.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "command,runs_directly",
+        [("make build", True), ("make what?", False), ("bu nədir", False)],
+    )
+    async def test_short_input_runs_unless_it_is_a_question(
+        self, command, runs_directly
+    ):
+        """Test short input runs directly unless it reads like a question."""
+        await self.handler._process_terminal_command(command)
+
+        manager = self.smart_cli.terminal_manager
+        assert manager.execute_command.await_count == int(runs_directly)
+        assert manager.execute_with_ai_assistance.await_count == int(not runs_directly)
+
+    @pytest.mark.parametrize(
+        "cmd,description",
+        [
+            ("ls -la", "List files and directories"),
+            ("  grep\t-r x", "Search text in files"),
+            ("make build", "Execute command"),
+            ("", "Execute command"),
+        ],
+    )
+    def test_command_description(self, cmd, description):
+        """Test suggestions are described by their first word."""
+        assert self.handler._get_command_description(cmd) == description
+
+    @pytest.mark.parametrize(
+        "command,expected",
+        [
+            ("Please RUN npm test", "npm test"),
+            ("execute it, then run ls", "ls"),
+            ("çalıştır pytest -q", "pytest -q"),
+            ("run ", ""),
+            ("npm test", ""),
+        ],
+    )
+    def test_extract_command_from_natural_language(self, command, expected):
+        """Test the text after the first matching run verb is extracted."""
+        result = self.handler._extract_command_from_natural_language(
+            command, command.lower()
+        )
+        assert result == expected
@@ -0,0 +1,193 @@
+"""Tests for the Smart CLI terminal UI state tracking."""
+
+import asyncio
+import re
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.core.terminal_ui import (
+    MAX_EVENTS,
+    PIPELINE_AGENTS,
+    PIPELINE_PHASES,
+    REFRESH_INTERVAL,
+    AgentStatus,
+    PhaseStatus,
+    SmartTerminalUI,
+    _format_mm_ss,
+)
+
+
+class TestTerminalUIState:
+    """Test phase, agent and event bookkeeping."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.ui = SmartTerminalUI("test-project")
+
+    def test_phase_lifecycle(self):
+        """Test starting, updating and completing a phase."""
+        self.ui.start_phase("analysis")
+        self.ui.update_phase_progress("analysis", 40)
+
+        phase = self.ui._phase_by_name["analysis"]
+        assert phase.status == PhaseStatus.RUNNING
+        assert phase.progress == 40
+
+        self.ui.complete_phase("analysis", success=True)
+        assert phase.status == PhaseStatus.COMPLETED
+        assert phase.progress == 100
+
+    def test_agent_lifecycle(self):
+        """Test starting, updating and failing an agent."""
+        self.ui.start_agent("modifier", "Apply patch")
+        self.ui.update_agent_progress("modifier", 60, {"files": 2})
+        self.ui.complete_agent("modifier", success=False)
+
+        agent = self.ui.agents["modifier"]
+        assert agent.status == AgentStatus.FAILED
+        assert agent.progress == 60
+        assert agent.metrics == {"files": 2}
+        assert agent.metrics_summary == "files: 2"
+
+    def test_unknown_names_are_ignored(self):
+        """Test updates for unknown phases and agents are no-ops."""
+        self.ui.start_phase("unknown")
+        self.ui.complete_agent("unknown")
+        assert len(self.ui.events) == 0
+
+    def test_events_are_bounded(self):
+        """Test only the most recent events are kept."""
+        for i in range(MAX_EVENTS + 10):
+            self.ui.add_event("ℹ️", "System", f"event {i}")
+
+        assert len(self.ui.events) == MAX_EVENTS
+        assert self.ui.events[0].message == "event 10"
+        assert self.ui.events[-1].message == f"event {MAX_EVENTS + 9}"
+
+    def test_focus_content_cached_until_state_changes(self):
+        """Test focus text is rebuilt only after a phase or agent update."""
+        assert self.ui._get_default_focus_content() == "System ready\nAwaiting tasks..."
+        assert self.ui._get_default_focus_content() is self.ui._focus_content
+
+        self.ui.start_agent("tester", "Run suite")
+        self.ui.update_agent_progress("tester", 30)
+        content = self.ui._get_default_focus_content()
+        assert content == "Active: Testing\nTask: Run suite\nProgress: 30%"
+
+        self.ui.update_agent_progress("tester", 70)
+        assert "Progress: 70%" in self.ui._get_default_focus_content()
+
+    def test_final_summary_lists_finished_phases(self):
+        """Test the summary includes only completed or failed phases."""
+        self.ui.start_phase("analysis")
+        self.ui.complete_phase("analysis")
+        self.ui.start_phase("testing")
+        self.ui.complete_phase("testing", success=False)
+        self.ui.start_phase("review")
+
+        summary = self.ui.create_final_summary()
+        assert "- Analysis: 00s ✅" in summary
+        assert "- Testing: 00s ❌" in summary
+        assert "Review" not in summary
+
+    def test_focus_content_shows_agent_metrics(self):
+        """Test the active agent's metrics appear in the focus text."""
+        self.ui.start_agent("analyzer", "Scan")
+        self.ui.update_agent_progress("analyzer", 10, {"files": 3})
+        self.ui.update_agent_progress("analyzer", 20, {"issues": 1})
+
+        content = self.ui._get_default_focus_content()
+        assert content.endswith("Metrics: files: 3 | issues: 1")
+
+    def test_run_id_uses_local_hour(self):
+        """Test the run id is the local date and hour."""
+        assert re.fullmatch(r"#\d{4}-\d{2}-\d{2}-\d{2}", self.ui.run_id)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need Python 3.10")
+    def test_state_records_use_slots(self):
+        """Test phase, agent and event records have no per-instance dict."""
+        self.ui.add_event("ℹ️", "System", "hello")
+        for record in (
+            self.ui.phases[0],
+            self.ui.agents["analyzer"],
+            self.ui.events[0],
+        ):
+            assert not hasattr(record, "__dict__")
+
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [(0, "00:00"), (65.9, "01:05"), (5999, "99:59"), (6000, "100:00")],
+    )
+    def test_format_mm_ss(self, seconds, expected):
+        """Test elapsed time formatting."""
+        assert _format_mm_ss(seconds) == expected
+
+    def test_phase_duration_uses_monotonic_clock(self):
+        """Test phase durations are measured with time.monotonic."""
+        with patch("src.core.terminal_ui.time.monotonic", side_effect=[100.0, 102.5]):
+            self.ui.start_phase("review")
+            self.ui.update_phase_progress("review", 50)
+
+        assert self.ui._phase_by_name["review"].duration == 2.5
+
+    def test_state_built_from_pipeline_tables(self):
+        """Test phases and agents are created fresh from the pipeline tables."""
+        other = SmartTerminalUI()
+        assert [p.name for p in self.ui.phases] == [n for n, _ in PIPELINE_PHASES]
+        assert list(self.ui.agents) == [n for n, _, _ in PIPELINE_AGENTS]
+        assert self.ui.phases[0] is not other.phases[0]
+        assert self.ui.agents["tester"].metrics is not other.agents["tester"].metrics
+
+    def test_focus_prefers_first_running_agent_then_phase(self):
+        """Test focus follows display order and falls back to running phases."""
+        self.ui.start_phase("implementation")
+        self.ui.start_agent("reviewer", "Review")
+        self.ui.start_agent("architect", "Design")
+        assert self.ui._get_default_focus_content().startswith(
+            "Active: System Architect"
+        )
+
+        self.ui.complete_agent("architect")
+        self.ui.complete_agent("reviewer")
+        assert self.ui._get_default_focus_content().startswith("Phase: Implementation")
+
+        self.ui.complete_phase("implementation")
+        assert self.ui._get_default_focus_content() == "System ready\nAwaiting tasks..."
+
+
+class TestTerminalUIRefresh:
+    """Test coalescing of refreshes."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.ui = SmartTerminalUI("test-project")
+        self.refresh_count = 0
+
+        def count_refresh():
+            self.refresh_count += 1
+
+        self.ui.refresh = count_refresh
+
+    def test_no_event_loop_only_marks_dirty(self):
+        """Test updates outside an event loop do not schedule a refresh."""
+        self.ui.add_event("ℹ️", "System", "hello")
+        assert self.ui._dirty
+        assert self.ui._refresh_handle is None
+
+    @pytest.mark.asyncio
+    async def test_burst_of_updates_refreshes_once(self):
+        """Test many updates within one interval produce a single refresh."""
+        self.ui.start_phase("analysis")
+        for progress in range(0, 100, 5):
+            self.ui.update_phase_progress("analysis", progress)
+        self.ui.update_agent_progress("analyzer", 50, {"files": 1})
+
+        await asyncio.sleep(REFRESH_INTERVAL * 3)
+        assert self.refresh_count == 1
+        assert not self.ui._dirty
+
+        self.ui.complete_phase("analysis")
+        await asyncio.sleep(REFRESH_INTERVAL * 3)
+        assert self.refresh_count == 2